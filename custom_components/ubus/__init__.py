@@ -18,14 +18,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # 创建协调器
         coordinator = OpenWrtDataUpdateCoordinator(hass, entry)
 
+        # 从持久缓存恢复协议、能力表和发现结果，首次刷新只需一轮批量请求
+        await coordinator.async_load_cache()
+
         # 执行首次数据刷新
         await coordinator.async_config_entry_first_refresh()
 
+        # 使用缓存启动时，在后台重新发现传感器/无线对象并更新缓存
+        if coordinator.cache_loaded:
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh_discovery(), name=f"{DOMAIN} discovery {coordinator.host}"
+            )
+
         # 存储协调器
         hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-        # 设置传感器、开关和按钮平台
-        await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "switch", "button"])
+        # 设置传感器、开关、按钮和设备跟踪平台
+        await hass.config_entries.async_forward_entry_setups(entry, ["sensor", "switch", "button", "device_tracker"])
+
+        # 选项变化后重新加载，使新的扫描间隔/数据源设置生效
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
         _LOGGER.info("OpenWrt Monitor integration setup completed for %s", entry.data.get("host", "unknown"))
         return True
@@ -34,11 +46,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to setup OpenWrt Monitor integration: %s", e)
         return False
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """选项更新后重新加载配置条目"""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """卸载OpenWrt Monitor配置条目"""
     try:
-        # 卸载传感器、开关和按钮平台
-        unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "switch", "button"])
+        # 卸载传感器、开关、按钮和设备跟踪平台
+        unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor", "switch", "button", "device_tracker"])
 
         if unload_ok:
             # 清理协调器
@@ -51,3 +67,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         _LOGGER.error("Failed to unload OpenWrt Monitor integration: %s", e)
         return False
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """删除OpenWrt Monitor配置条目时清理持久缓存"""
+    from homeassistant.helpers.storage import Store
+    from .coordinator import STORAGE_VERSION
+
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
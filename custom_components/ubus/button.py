@@ -15,7 +15,8 @@ class OpenWrtRestartButton(CoordinatorEntity, ButtonEntity):
     """Restart button for a specific OpenWrt interface."""
 
     def __init__(self, coordinator, interface_name: str):
-        super().__init__(coordinator)
+        # Button state does not depend on polled data; only availability changes wake it
+        super().__init__(coordinator, context=frozenset())
         # Buttons (restart per-interface) are disabled by default; user must enable them
         try:
             self._attr_entity_registry_enabled_default = False
@@ -25,12 +26,12 @@ class OpenWrtRestartButton(CoordinatorEntity, ButtonEntity):
         # Display name: do not prefix with integration name
         # Display name: use translation key with placeholder
         # Determine a friendly interface display name from coordinator data when available
-        iface_data = {}
+        iface_data = None
         try:
-            iface_data = coordinator.data.get("interfaces", {}).get(interface_name, {}) or {}
+            iface_data = coordinator.data.get("interfaces", {}).get(interface_name)
         except Exception:
-            iface_data = {}
-        display = iface_data.get("ifname") or iface_data.get("name") or iface_data.get("l3_device") or interface_name
+            iface_data = None
+        display = getattr(iface_data, "l3_device", None) or interface_name
         # Set translation key and also set an explicit fallback name so
         # integrations that don't use translation or for new entities
         # will display a friendly name instead of the raw iface key/IP.
@@ -146,7 +147,7 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddE
         except Exception as e:
             _LOGGER.debug("Failed to schedule dynamic button add handler: %s", e)
 
-    remove_listener = coordinator.async_add_listener(_handle_update)
+    remove_listener = coordinator.async_add_listener(_handle_update, frozenset({"interfaces"}))
     try:
         entry.async_on_unload(remove_listener)
     except Exception:
@@ -173,7 +174,8 @@ class OpenWrtRebootButton(CoordinatorEntity, ButtonEntity):
     """Button entity to reboot the router."""
 
     def __init__(self, coordinator):
-        super().__init__(coordinator)
+        # Button state does not depend on polled data; only availability changes wake it
+        super().__init__(coordinator, context=frozenset())
         try:
             self._attr_translation_key = "reboot"
         except Exception:
@@ -4,7 +4,12 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-from .const import DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, CONF_DISABLED_SOURCES
+from .const import CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS, CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD
+from .const import CONF_POLL_TIMEOUT, DEFAULT_POLL_TIMEOUT, CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE
+from .const import CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME, CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS
+from .const import CONF_KEEP_RAW_DATA, DEFAULT_KEEP_RAW_DATA
+from .sources import SOURCE_KEYS
 import aiohttp
 import logging
 import asyncio
@@ -142,13 +147,46 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        current = {**self._config_entry.data, **self._config_entry.options}
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional(
                     CONF_SCAN_INTERVAL, 
-                    default=self._config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+                    default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
                 ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=current.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+                vol.Optional(
+                    CONF_POLL_TIMEOUT,
+                    default=current.get(CONF_POLL_TIMEOUT, DEFAULT_POLL_TIMEOUT),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=120)),
+                vol.Optional(
+                    CONF_MAX_STALE_AGE,
+                    default=current.get(CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_FAILURE_THRESHOLD,
+                    default=current.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(
+                    CONF_CONSIDER_HOME,
+                    default=current.get(CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_EVENT_SUBSCRIPTIONS,
+                    default=current.get(CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS),
+                ): bool,
+                vol.Optional(
+                    CONF_KEEP_RAW_DATA,
+                    default=current.get(CONF_KEEP_RAW_DATA, DEFAULT_KEEP_RAW_DATA),
+                ): bool,
+                vol.Optional(
+                    CONF_DISABLED_SOURCES,
+                    default=current.get(CONF_DISABLED_SOURCES, []),
+                ): cv.multi_select({key: key for key in SOURCE_KEYS}),
             }),
             errors=errors,
         )
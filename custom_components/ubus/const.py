@@ -4,3 +4,18 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 30
+CONF_DISABLED_SOURCES = "disabled_sources"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 2
+CONF_FAILURE_THRESHOLD = "failure_threshold"
+DEFAULT_FAILURE_THRESHOLD = 3
+CONF_POLL_TIMEOUT = "poll_timeout"
+DEFAULT_POLL_TIMEOUT = 20
+CONF_MAX_STALE_AGE = "max_stale_age"
+DEFAULT_MAX_STALE_AGE = 900
+CONF_CONSIDER_HOME = "consider_home"
+DEFAULT_CONSIDER_HOME = 180
+CONF_EVENT_SUBSCRIPTIONS = "event_subscriptions"
+DEFAULT_EVENT_SUBSCRIPTIONS = False
+CONF_KEEP_RAW_DATA = "keep_raw_data"
+DEFAULT_KEEP_RAW_DATA = False
@@ -1,23 +1,122 @@
 import logging
 from datetime import timedelta
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL
+from homeassistant.helpers.storage import Store
+from .const import (
+    DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL,
+    CONF_DISABLED_SOURCES, CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS,
+    CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD, CONF_POLL_TIMEOUT, DEFAULT_POLL_TIMEOUT,
+    CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE, CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS,
+    CONF_KEEP_RAW_DATA, DEFAULT_KEEP_RAW_DATA,
+)
+from .events import UbusEventStreams
+from .leases import (
+    LeaseTable, normalize_mac, parse_generic_leases, parse_lease_file, parse_luci_leases, parse_odhcpd_leases,
+)
+from .logs import LogTail, log_read_params, parse_log_entries
+from .records import Temperature
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RequestScheduler
+from .sources import POLL_SOURCES, POLL_TIER_INTERVALS, RATE_COUNTERS, interface_fields
+from .stations import Station, StationTable, parse_hostapd_clients, parse_iwinfo_assoclist
+from .values import SnapshotValues
+from dataclasses import replace
 import aiohttp
 import asyncio
 import ssl
+import time
 
 _LOGGER = logging.getLogger(__name__)
 
-# 某些 ubus 方法在不同固件/版本上并非必定存在，这些调用失败不应每次都写 WARNING
-OPTIONAL_UBUS_METHODS = {
+# 已确定的协议连续传输失败达到该次数后，重新探测 HTTPS/HTTP
+PROTOCOL_REPROBE_THRESHOLD = 3
+
+# 熔断后探测路由器的退避时间（秒），每次探测失败翻倍，直到上限
+BREAKER_BASE_BACKOFF = 30
+BREAKER_MAX_BACKOFF = 900
+
+# 熔断期间的探测请求：只列出 session 对象，无需登录且响应很小
+BREAKER_PROBE = {"jsonrpc": "2.0", "id": 1, "method": "list", "params": ["session"]}
+
+# ubus 对象/方法能力表（来自 JSON-RPC list）的有效期，过期后重新获取
+CAPABILITY_TTL = 3600
+
+# 已确认不存在的方法在负缓存中保留的时间，期间不会再发起请求
+UNSUPPORTED_TTL = 3600
+
+# 会话剩余时间少于该秒数时提前重新登录；rpcd 默认空闲 300 秒后使会话失效
+SESSION_RENEW_MARGIN = 30
+DEFAULT_SESSION_TIMEOUT = 300
+
+# JSON-RPC 错误码与 ubus 状态码
+JSONRPC_OBJECT_NOT_FOUND = -32000
+JSONRPC_ACCESS_DENIED = -32002
+UBUS_STATUS_METHOD_NOT_FOUND = 3
+UBUS_STATUS_NOT_SUPPORTED = 8
+
+# 会改变路由器状态的 ubus 方法名：轮询只读，这些方法只允许由开关/按钮/服务等显式操作调用
+MUTATING_UBUS_METHODS = frozenset({
+    "reload", "restart", "reboot", "up", "down", "ifup", "ifdown", "renew", "reconf",
+    "set", "add", "delete", "remove", "rename", "apply", "commit", "confirm", "rollback", "revert",
+    "exec", "write", "signal", "kill", "start", "stop", "sysupgrade", "upgrade",
+    "del_client", "switch_chan", "wps_start", "wps_cancel", "scan", "destroy", "grant", "revoke",
+})
+
+# 已知的只读 ubus 方法名，轮询时无需额外核对
+READONLY_UBUS_METHODS = frozenset({
+    "board", "info", "status", "dump", "list", "get", "read", "stat", "md5", "access",
+    "devices", "assoclist", "get_clients", "freqlist", "txpowerlist", "countrylist",
+    "leases", "ipv4leases", "ipv6leases", "getDHCPLeases", "processes",
+})
+
+# sysfs 温度传感器发现结果的有效期；检测到重启时也会重新发现
+SENSOR_DISCOVERY_INTERVAL = 6 * 3600
+
+# file.list 不可用时回退探测的 hwmon 数量
+HWMON_PROBE_COUNT = 32
+
+# 32 位计数器的回绕范围；只有旧值在上半区、新值在下半区且回绕后的差值不超过一半时才视为回绕，
+# 其它变小的情况视为计数器被重置
+COUNTER_WRAP_32 = 1 << 32
+
+# DHCP 租约来源：按优先级排列的 ubus 方法与租约文件；确定可用的来源后只轮询它，
+# 每隔 DHCP_SOURCE_REVALIDATE 秒或来源失败时重新检测
+DHCP_UBUS_SOURCES = (
+    ("luci-rpc", "getDHCPLeases"),
+    ("dhcp", "ipv4leases"),
     ("dhcp", "leases"),
     ("dhcp", "get_leases"),
     ("dnsmasq", "leases"),
-    ("dnsmasq", "get_leases"),
     ("odhcpd", "leases"),
-    ("network.wireless", "status"),
-}
+    ("dnsmasq", "get_leases"),
+)
+DHCP_LEASE_FILES = ("/tmp/dhcp.leases", "/var/lib/misc/dnsmasq.leases", "/var/lib/dhcp/dhcpd.leases")
+DHCP_SOURCE_REVALIDATE = 3600
+# 检测时所有来源都不可用；到重新检测之前不再请求租约
+DHCP_SOURCE_NONE = ""
+
+# 事件订阅连接时，完整轮询的间隔放大为扫描间隔的倍数
+EVENT_POLL_FACTOR = 4
+
+# hostapd 的终端关联/断开通知
+STATION_JOIN_EVENTS = ("assoc", "sta-authorized")
+STATION_LEAVE_EVENTS = ("disassoc", "deauth")
+
+# 静态事实（协议、能力表、板卡信息、发现结果）的持久缓存
+STORAGE_VERSION = 1
+CACHE_SAVE_DELAY = 10
+
+# 不参与变化比较的键：freshness 中的获取时间每轮都会变化
+CHANGE_IGNORED_KEYS = frozenset({"freshness"})
+
+# uhttpd 同时处理的请求数（max_requests 默认值）；事件订阅占用的名额从轮询并发数中扣除
+UHTTPD_MAX_REQUESTS = 3
+
+# 轮询时限中为复合数据源（终端、租约、温度、连接数）保留的比例，单次调用的批量请求最多使用其余部分
+COMPOSITE_BUDGET_SHARE = 0.4
+
+# 单个 JSON-RPC 批量请求中最多打包的调用数量，避免 uhttpd/rpcd 单次处理过大的请求体
+UBUS_BATCH_SIZE = 16
 
 class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, entry):
@@ -27,6 +126,14 @@ class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
         self.password = entry.data[CONF_PASSWORD]
         self.session_id = None
         self.entry = entry
+        # 会话空闲超时与预计失效时间（monotonic），每次成功调用都会顺延
+        self._session_timeout = DEFAULT_SESSION_TIMEOUT
+        self._session_expires_at = 0.0
+        self._login_lock = asyncio.Lock()
+        self._relogins = 0
+        # 每个轮询周期最多因 Access denied 重新登录一次
+        self._poll_cycle = 0
+        self._relogin_cycle = None
         
         # 创建SSL上下文，忽略自签名证书错误
         ssl_context = ssl.create_default_context()
@@ -37,8 +144,84 @@ class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
         connector = aiohttp.TCPConnector(ssl=ssl_context)
         self._session = aiohttp.ClientSession(connector=connector)
         
-        self._previous_data = {}  # 用于计算速率
-        update_interval = timedelta(seconds=entry.data.get(CONF_SCAN_INTERVAL, 30))
+        # 速率计算只保留每个设备上一次的计数器 {device: (时间戳, {counter: value})}
+        self._counters = {}
+        self._rates = {}
+        # 固件是否支持 JSON-RPC 批量请求：None 表示尚未探测，False 表示回退为单次调用
+        self._batch_supported = None
+        # 登录时确定的协议（https/http），之后的请求复用该协议
+        self._protocol = None
+        self._transport_failures = 0
+        # 熔断器：连续传输失败达到阈值后停止完整轮询，只按指数退避发送探测请求
+        self._breaker_until = None
+        self._breaker_backoff = 0
+        # ubus 能力表 {object: set(methods)} 以及不存在方法的负缓存 {(object, method): 过期时间}
+        self._capabilities = None
+        self._capabilities_at = 0.0
+        self._unsupported = {}
+        self._denied = set()
+        self._firmware = None
+        # 只读轮询的方法核对结果 {(object, method): 是否允许在轮询中调用}
+        self._poll_allowed = {}
+        # 已发现的 sysfs 温度输入 [{key, label, zone, path}]，None 表示需要重新发现
+        self._sensor_inputs = None
+        self._sensor_inputs_at = 0.0
+        # 已发现的无线对象 {"hostapd": [ubus 对象名], "iwinfo": [设备名]}，None 表示需要重新发现
+        self._wireless_objects = None
+        self._wireless_objects_at = 0.0
+        # 最近一次成功的 DHCP 租约来源（ubus 方法或租约文件）
+        self._dhcp_source = None
+        self._dhcp_source_at = 0.0
+        # 按 IP/MAC 索引的租约表，逐轮增量更新
+        self._lease_table = LeaseTable()
+        # 传感器平台共用的取值缓存，每个快照只批量计算一次
+        self.sensor_values = SnapshotValues()
+        # 按 MAC 索引的无线终端表
+        self._stations = StationTable()
+        # 系统日志的读取游标与环形缓冲区
+        self._log_tail = LogTail()
+        # 持久缓存：启动时从中恢复静态事实，跳过首次刷新中的发现过程
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+        self._cached_facts = None
+        self.cache_loaded = False
+        # 上次看到的运行时间，用于检测路由器重启
+        self._last_uptime = None
+        # 持久快照：各数据源最近一次解析后的结果及获取时间，按层级间隔刷新
+        self._results = {}
+        self._fetched_at = {}
+        # 各数据源最近一次成功获取的时间（epoch）以及本周期未能刷新的数据源
+        self._fetched_wall = {}
+        self._stale = set()
+        # 事件要求在下一轮立即刷新的数据源（不受层级间隔限制）
+        self._due_now = set()
+
+        # 选项优先于初始配置
+        self.options = {**entry.data, **entry.options}
+        self._failure_threshold = self.options.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD)
+        self._poll_timeout = self.options.get(CONF_POLL_TIMEOUT, DEFAULT_POLL_TIMEOUT)
+        self._max_stale_age = self.options.get(CONF_MAX_STALE_AGE, DEFAULT_MAX_STALE_AGE)
+        # 原始结果只在开启诊断时保留；没有实体使用的数据源也只在此时轮询
+        keep_raw = self.options.get(CONF_KEEP_RAW_DATA, DEFAULT_KEEP_RAW_DATA)
+        self._raw = {} if keep_raw else None
+        disabled = set(self.options.get(CONF_DISABLED_SOURCES) or [])
+        self._sources = [
+            source for source in POLL_SOURCES
+            if source.key not in disabled and (keep_raw or not source.diagnostic)
+        ]
+        # 上次通知监听器时的数据与成功状态，用于计算变化的键
+        self._notified_data = None
+        self._notified_success = None
+        self.changed_keys = None
+        self._notify_stats = {"notified": 0, "skipped": 0}
+        # 限制同时发往路由器的请求数，避免超出 uhttpd 的并发上限
+        self._max_concurrent = self.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+        self._scheduler = RequestScheduler(self._max_concurrent)
+        update_interval = timedelta(seconds=self.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        self._scan_interval = update_interval
+        # 可选的事件订阅：收到通知时直接修补快照，连接期间放慢完整轮询
+        self._events = None
+        if self.options.get(CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS):
+            self._events = UbusEventStreams(self, self._handle_event, self._events_changed)
 
         super().__init__(
             hass,
@@ -47,91 +230,175 @@ class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
-    async def _login(self):
+    @property
+    def url(self):
+        """当前使用的 ubus 地址；协议尚未确定时返回 None"""
+        if not self._protocol:
+            return None
+        return f"{self._protocol}://{self.host}/ubus"
+
+    async def _post(self, payload, priority=PRIORITY_BACKGROUND, probe=False):
+        """向 /ubus 发送 JSON-RPC 请求并返回解析后的响应，传输失败时返回 None
+
+        请求按 priority 在调度器中排队，交互操作优先于后台轮询。
+        熔断器打开期间只有探测请求（probe）和交互请求会真正发出，其它请求直接返回 None；
+        交互请求相当于一次探测，成功后熔断器关闭。
+
+        协议在首次成功请求（通常是登录）时确定并保持不变，之后的请求只使用该协议；
+        连续传输失败达到 PROTOCOL_REPROBE_THRESHOLD 次后才重新探测 HTTPS/HTTP。
+        """
+        if self._breaker_until is not None and not probe and priority != PRIORITY_INTERACTIVE:
+            return None
+
+        protocols = [self._protocol] if self._protocol else ["https", "http"]
+        for protocol in protocols:
+            url = f"{protocol}://{self.host}/ubus"
+            try:
+                async with self._scheduler.slot(priority):
+                    async with self._session.post(url, json=payload, timeout=10) as resp:
+                        if resp.status != 200:
+                            _LOGGER.debug("%s 请求失败，状态码: %s", url, resp.status)
+                            continue
+                        data = await resp.json()
+            except Exception as e:
+                _LOGGER.debug("%s 请求异常: %s", url, e)
+                continue
+
+            if self._protocol != protocol:
+                _LOGGER.info("使用 %s 访问 %s", protocol.upper(), url)
+                self._protocol = protocol
+            self._transport_failures = 0
+            if self._breaker_until is not None:
+                _LOGGER.info("%s 恢复连接，继续完整轮询", self.host)
+                self._breaker_until = None
+                self._breaker_backoff = 0
+            return data
+
+        self._transport_failures += 1
+        if self._breaker_until is None and self._transport_failures >= self._failure_threshold:
+            self._breaker_backoff = BREAKER_BASE_BACKOFF
+            self._breaker_until = time.monotonic() + self._breaker_backoff
+            _LOGGER.warning(
+                "%s 连续 %s 次传输失败，暂停轮询，%s 秒后探测",
+                self.host, self._transport_failures, self._breaker_backoff,
+            )
+        if self._protocol and self._transport_failures >= PROTOCOL_REPROBE_THRESHOLD:
+            _LOGGER.info(
+                "%s 连续 %s 次传输失败，下次请求重新探测协议", self.url, self._transport_failures
+            )
+            self._protocol = None
+        return None
+
+    async def _login(self, priority=PRIORITY_BACKGROUND):
         """登录OpenWrt并获取session"""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "call",
+            "params": [
+                "00000000000000000000000000000000",
+                "session",
+                "login",
+                {
+                    "username": self.username,
+                    "password": self.password
+                }
+            ]
+        }
+
         try:
-            # 尝试HTTPS Ubus登录
-            if await self._try_ubus_login("https"):
-                return
-            
-            # 如果HTTPS失败，尝试HTTP Ubus登录
-            if await self._try_ubus_login("http"):
+            data = await self._post(payload, priority)
+            if data is None:
+                _LOGGER.warning("Ubus登录失败: 无法连接 %s", self.host)
                 return
-                
+            if "result" in data and len(data["result"]) > 1:
+                session = data["result"][1]
+                self.session_id = session["ubus_rpc_session"]
+                self._session_timeout = session.get("timeout") or DEFAULT_SESSION_TIMEOUT
+                self._session_expires_at = time.monotonic() + (session.get("expires") or self._session_timeout)
+                _LOGGER.info("%s Ubus登录成功", self._protocol.upper())
+            else:
+                _LOGGER.warning("%s Ubus登录响应无效", self._protocol.upper())
         except Exception as e:
             _LOGGER.error("Ubus登录失败: %s", e)
             raise
 
-    async def _try_ubus_login(self, protocol):
-        """尝试指定协议的Ubus登录"""
-        try:
-            url = f"{protocol}://{self.host}/ubus"
+    async def _ensure_session(self, priority=PRIORITY_BACKGROUND):
+        """没有会话或会话即将失效时（重新）登录；并发调用只会触发一次登录"""
+        if self.session_id and time.monotonic() < self._session_expires_at - SESSION_RENEW_MARGIN:
+            return
+        async with self._login_lock:
+            if self.session_id and time.monotonic() < self._session_expires_at - SESSION_RENEW_MARGIN:
+                return
+            if self.session_id:
+                _LOGGER.debug("会话即将过期，提前重新登录")
+            await self._login(priority)
+
+    def _session_used(self):
+        """rpcd 每次成功调用都会刷新会话的空闲计时"""
+        self._session_expires_at = time.monotonic() + self._session_timeout
+
+    async def _async_relogin(self, stale_session, priority=PRIORITY_BACKGROUND):
+        """收到 Access denied 后重新登录一次，返回是否可以重试
+
+        其它并发调用已经换过会话时直接重试；同一轮询周期内只重新登录一次，
+        避免 ACL 真正拒绝的方法导致反复登录。
+        """
+        async with self._login_lock:
+            if self.session_id and self.session_id != stale_session:
+                return True
+            if self._relogin_cycle == self._poll_cycle:
+                return False
+            self._relogin_cycle = self._poll_cycle
+            self._relogins += 1
+            _LOGGER.info("会话已失效（Access denied），重新登录")
+            self.session_id = None
+            await self._login(priority)
+            return self.session_id is not None
+
+    @staticmethod
+    def _is_access_denied(reply):
+        error = reply.get("error") if isinstance(reply, dict) else None
+        return isinstance(error, dict) and error.get("code") == JSONRPC_ACCESS_DENIED
+
+    async def _ubus_call(self, namespace, method, params=None, readonly=True, priority=PRIORITY_BACKGROUND):
+        """调用OpenWrt Ubus API；readonly 为 True（轮询）时拒绝会修改路由器状态的方法"""
+        if self._is_unsupported(namespace, method):
+            return None
+
+        await self._ensure_session(priority)
+
+        if readonly:
+            await self._async_check_readonly([(namespace, method, params)])
+            if not self._poll_allowed.get((namespace, method)):
+                return None
+
+        for attempt in range(2):
+            session = self.session_id
             payload = {
                 "jsonrpc": "2.0",
-                "id": 1,
+                "id": 2,
                 "method": "call",
                 "params": [
-                    "00000000000000000000000000000000",
-                    "session",
-                    "login",
-                    {
-                        "username": self.username,
-                        "password": self.password
-                    }
+                    session,
+                    namespace,
+                    method,
+                    params or {}
                 ]
             }
-            
-            _LOGGER.info("尝试 %s Ubus登录: %s", protocol.upper(), url)
-            
-            async with self._session.post(url, json=payload, timeout=10) as resp:
-                if resp.status != 200:
-                    _LOGGER.warning("%s Ubus登录失败，状态码: %s", protocol.upper(), resp.status)
-                    return False
-                data = await resp.json()
-                if "result" in data and len(data["result"]) > 1:
-                    self.session_id = data["result"][1]["ubus_rpc_session"]
-                    _LOGGER.info("%s Ubus登录成功", protocol.upper())
-                    return True
-                else:
-                    _LOGGER.warning("%s Ubus登录响应无效", protocol.upper())
-                    return False
-        except Exception as e:
-            _LOGGER.warning("%s Ubus登录异常: %s", protocol.upper(), e)
-            return False
 
-    async def _ubus_call(self, namespace, method, params=None):
-        """调用OpenWrt Ubus API"""
-        if not self.session_id:
-            await self._login()
-        
-        # 尝试HTTPS和HTTP
-        for protocol in ["https", "http"]:
-            try:
-                url = f"{protocol}://{self.host}/ubus"
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "call",
-                    "params": [
-                        self.session_id,
-                        namespace,
-                        method,
-                        params or {}
-                    ]
-                }
-                
-                async with self._session.post(url, json=payload, timeout=10) as resp:
-                    if resp.status != 200:
-                        continue
-                    data = await resp.json()
-                    if "result" in data and len(data["result"]) > 1:
-                        return data["result"][1]
-                    else:
-                        continue
-            except Exception as e:
-                _LOGGER.debug("Ubus调用失败 %s.%s via %s: %s", namespace, method, protocol, e)
-                continue
-        
+            data = await self._post(payload, priority)
+            if not self._is_access_denied(data):
+                break
+            # 已知被 ACL 拒绝的方法不重新登录
+            if attempt or (namespace, method) in self._denied or not await self._async_relogin(session, priority):
+                break
+        if data is not None and not self._is_access_denied(data):
+            self._session_used()
+        result = self._parse_reply(namespace, method, data)
+        if result is not None:
+            return result
+
         # 对于可选的 ubus 方法，使用 DEBUG 级别以避免日志噪音；其它情况保留 WARNING
         # 把 Ubus 调用失败都记录为 DEBUG（避免在正常运行时刷屏），只有在需要时开启 debug 日志查看详情
         # 动态的 hostapd 对象（如 hostapd.phy0-ap0）调用 get_clients 也视为可选
@@ -141,21 +408,273 @@ class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Ubus调用失败 %s.%s", namespace, method)
         return None
 
-    def _convert_bytes_to_mb(self, bytes_value):
-        """将字节转换为MB"""
-        if bytes_value is None:
-            return 0
-        return round(bytes_value / (1024 * 1024), 2)
-
-    def _calculate_cpu_load_percentage(self, load_value):
-        """将CPU负载转换为百分比"""
-        if load_value is None:
-            return 0
-        # OpenWrt 24.10+ 的负载值通常是整数，需要转换为百分比
-        # 根据实际测试调整最大负载值
-        max_load = 100000
-        percentage = min((load_value / max_load) * 100, 100)
-        return round(percentage, 2)
+    async def _ubus_batch(self, calls, readonly=True):
+        """批量调用 Ubus API
+
+        calls 为 (namespace, method, params) 元组列表，多个调用被打包进一个
+        JSON-RPC 数组请求，并按 id 将响应拆分回来。返回与 calls 顺序一致的
+        结果列表，失败的调用对应 None。固件不接受批量请求时自动回退为单次调用。
+        readonly 为 True（轮询）时会修改路由器状态的方法不会被请求。
+        """
+        if not calls:
+            return []
+
+        await self._ensure_session()
+        if readonly:
+            await self._async_check_readonly(calls)
+
+        # 已知不存在或只读轮询不允许的方法直接返回 None，不进入请求
+        results = [None] * len(calls)
+        pending = [
+            i for i, (ns, method, _params) in enumerate(calls)
+            if not self._is_unsupported(ns, method) and (not readonly or self._poll_allowed.get((ns, method)))
+        ]
+        if not pending:
+            return results
+        pending_calls = [calls[i] for i in pending]
+
+        if self._batch_supported is False or len(pending_calls) == 1:
+            fetched = await asyncio.gather(
+                *(self._ubus_call(ns, method, params, readonly) for ns, method, params in pending_calls)
+            )
+        else:
+            chunks = [pending_calls[i:i + UBUS_BATCH_SIZE] for i in range(0, len(pending_calls), UBUS_BATCH_SIZE)]
+            chunk_results = await asyncio.gather(*(self._post_batch(chunk) for chunk in chunks))
+
+            fetched = []
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                if chunk_result is None:
+                    # 批量请求被拒绝，回退为逐个调用
+                    chunk_result = await asyncio.gather(
+                        *(self._ubus_call(ns, method, params, readonly) for ns, method, params in chunk)
+                    )
+                fetched.extend(chunk_result)
+
+        for i, result in zip(pending, fetched):
+            results[i] = result
+        return results
+
+    async def _post_batch(self, calls, retry=True):
+        """发送一个 JSON-RPC 批量请求，返回结果列表；固件不支持批量请求时返回 None
+
+        整批都返回 Access denied 时说明会话已失效，重新登录后重试一次。
+        """
+        session = self.session_id
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": idx,
+                "method": "call",
+                "params": [session, namespace, method, params or {}],
+            }
+            for idx, (namespace, method, params) in enumerate(calls, start=1)
+        ]
+
+        data = await self._post(payload)
+        if data is None:
+            # 传输失败，视为全部失败
+            return [None] * len(calls)
+
+        if not isinstance(data, list):
+            # 老版本 uhttpd-mod-ubus 只接受单个对象，返回 invalid request 错误
+            if self._batch_supported is not False:
+                _LOGGER.debug("固件不支持 JSON-RPC 批量请求，回退为单次调用")
+            self._batch_supported = False
+            return None
+
+        self._batch_supported = True
+        replies = {reply.get("id"): reply for reply in data if isinstance(reply, dict)}
+        if replies and all(self._is_access_denied(reply) for reply in replies.values()):
+            known_denied = all((namespace, method) in self._denied for namespace, method, _params in calls)
+            if retry and not known_denied and await self._async_relogin(session):
+                return await self._post_batch(calls, retry=False)
+        else:
+            self._session_used()
+        results = []
+        for idx, (namespace, method, _params) in enumerate(calls, start=1):
+            result = self._parse_reply(namespace, method, replies.get(idx))
+            if result is None:
+                _LOGGER.debug("Ubus调用失败 %s.%s (batch)", namespace, method)
+            results.append(result)
+        return results
+
+    def _parse_reply(self, namespace, method, reply):
+        """解析单条 JSON-RPC 响应，返回数据部分；失败时返回 None 并根据错误码更新负缓存
+
+        "Object not found" 与 ubus 的 METHOD_NOT_FOUND/NOT_SUPPORTED 表示方法不存在，
+        进入负缓存；"Access denied" 在调用方重新登录重试后仍出现时视为 ACL 未授权，仅做记录。
+        """
+        if not isinstance(reply, dict):
+            return None
+
+        error = reply.get("error")
+        if isinstance(error, dict):
+            code = error.get("code")
+            if code == JSONRPC_OBJECT_NOT_FOUND:
+                self._mark_unsupported(namespace, method)
+            elif code == JSONRPC_ACCESS_DENIED:
+                self._denied.add((namespace, method))
+            return None
+
+        result = reply.get("result")
+        if not isinstance(result, list) or not result:
+            return None
+        if result[0] in (UBUS_STATUS_METHOD_NOT_FOUND, UBUS_STATUS_NOT_SUPPORTED):
+            self._mark_unsupported(namespace, method)
+            return None
+        self._denied.discard((namespace, method))
+        return result[1] if len(result) > 1 else None
+
+    def _mark_unsupported(self, namespace, method):
+        """把方法加入负缓存"""
+        if (namespace, method) not in self._unsupported:
+            _LOGGER.debug("Ubus方法不存在，%s 秒内不再请求: %s.%s", UNSUPPORTED_TTL, namespace, method)
+        self._unsupported[(namespace, method)] = time.monotonic() + UNSUPPORTED_TTL
+
+    def _is_unsupported(self, namespace, method):
+        """判断方法是否已知不存在（负缓存未过期或能力表中没有该方法）"""
+        expires = self._unsupported.get((namespace, method))
+        if expires is not None:
+            if expires > time.monotonic():
+                return True
+            del self._unsupported[(namespace, method)]
+        if self._capabilities is not None:
+            methods = self._capabilities.get(namespace)
+            return methods is None or method not in methods
+        return False
+
+    async def _async_check_readonly(self, calls):
+        """只读轮询核对：会修改状态的方法一律拒绝，未知方法需出现在 ubus 签名中且 rpcd ACL 允许"""
+        unknown = []
+        for namespace, method, _params in calls:
+            key = (namespace, method)
+            if key in self._poll_allowed or key in unknown or self._is_unsupported(namespace, method):
+                continue
+            if method in MUTATING_UBUS_METHODS:
+                _LOGGER.warning("轮询中拒绝调用会修改路由器状态的方法 %s.%s", namespace, method)
+                self._poll_allowed[key] = False
+            elif method in READONLY_UBUS_METHODS:
+                self._poll_allowed[key] = True
+            else:
+                unknown.append(key)
+
+        if not unknown:
+            return
+
+        access_results = await self._ubus_batch(
+            [
+                ("session", "access", {
+                    "ubus_rpc_session": self.session_id,
+                    "scope": "ubus",
+                    "object": namespace,
+                    "function": method,
+                })
+                for namespace, method in unknown
+            ],
+            readonly=False,
+        )
+        for (namespace, method), access in zip(unknown, access_results):
+            # 能力表缺失时无法核对签名，保守地不在轮询中调用
+            allowed = self._capabilities is not None and isinstance(access, dict) and bool(access.get("access"))
+            self._poll_allowed[(namespace, method)] = allowed
+            _LOGGER.debug("只读轮询核对 %s.%s: %s", namespace, method, "允许" if allowed else "跳过")
+
+    async def _async_refresh_capabilities(self, force=False):
+        """通过 JSON-RPC list 获取 ubus 对象与方法能力表，在有效期内复用"""
+        if not force and self._capabilities is not None and time.monotonic() - self._capabilities_at < CAPABILITY_TTL:
+            return
+
+        data = await self._post({"jsonrpc": "2.0", "id": 1, "method": "list", "params": ["*"]})
+        result = data.get("result") if isinstance(data, dict) else None
+        if not isinstance(result, dict) or not result:
+            _LOGGER.debug("无法获取 ubus 对象列表，跳过能力检测")
+            return
+
+        self._capabilities = {
+            obj: set(methods.keys()) if isinstance(methods, dict) else set()
+            for obj, methods in result.items()
+        }
+        self._capabilities_at = time.monotonic()
+        self._unsupported.clear()
+        self._poll_allowed.clear()
+        _LOGGER.debug("已获取 %s 个 ubus 对象的能力表", len(self._capabilities))
+
+    def _check_firmware(self, board):
+        """固件版本变化时清空能力表、负缓存以及缓存的协议和批量请求支持情况"""
+        release = board.get("release") if isinstance(board, dict) else None
+        if not isinstance(release, dict):
+            return
+        firmware = (release.get("version"), release.get("revision"))
+        if self._firmware is not None and firmware != self._firmware:
+            _LOGGER.info("检测到固件变化 %s -> %s，重新检测 ubus 能力", self._firmware, firmware)
+            self._capabilities = None
+            self._unsupported.clear()
+            self._denied.clear()
+            self._poll_allowed.clear()
+            self._dhcp_source = None
+            # 升级后 uhttpd 的配置可能改变（例如启用或关闭 HTTPS、批量请求），重新探测
+            self._batch_supported = None
+            self._protocol = None
+        self._firmware = firmware
+
+    def _check_reboot(self, uptime):
+        """运行时间变小说明路由器重启过，丢弃依赖运行状态的发现结果"""
+        if not isinstance(uptime, (int, float)) or uptime <= 0:
+            return
+        if self._last_uptime is not None and uptime < self._last_uptime:
+            _LOGGER.info("检测到路由器重启（运行时间 %s -> %s），重新发现传感器", self._last_uptime, uptime)
+            self._sensor_inputs = None
+            self._wireless_objects = None
+            self._counters.clear()
+            self._stations.reset()
+            self._log_tail.reset()
+        self._last_uptime = uptime
+
+    def _is_due(self, source, now):
+        """判断数据源是否到了刷新时间"""
+        if source.key in self._due_now:
+            return True
+        fetched_at = self._fetched_at.get(source.key)
+        # 每个周期的开始时间会有几毫秒的漂移，留出半个扫描间隔的容差，避免到期的数据源被推迟一整个周期
+        tolerance = self._scan_interval.total_seconds() / 2
+        return fetched_at is None or now - fetched_at >= POLL_TIER_INTERVALS[source.tier] - tolerance
+
+    def _store_result(self, source, result, now, timed_out=False):
+        """把数据源结果写入快照；失败的数据源不记录时间，下个周期重试
+
+        失败或超出轮询时限的数据源保留上次成功的结果并标记为过期，
+        超过 max_stale_age 后才丢弃（见 _snapshot_value）。
+        """
+        if timed_out:
+            if source.key in self._fetched_wall:
+                # 从未获取成功的数据源没有可沿用的结果，不算过期
+                self._stale.add(source.key)
+            _LOGGER.debug("数据源 %s 超出轮询时限，沿用上次的结果", source.key)
+            return
+        if result is not None:
+            # 获取时解析一次，未到期的周期直接复用解析结果
+            self._results[source.key] = source.parse(result)
+            self._due_now.discard(source.key)
+            if self._raw is not None:
+                self._raw[source.key] = result
+            self._fetched_at[source.key] = now
+            self._fetched_wall[source.key] = time.time()
+            self._stale.discard(source.key)
+            return
+        if source.key in self._fetched_wall:
+            # 从未获取成功的数据源（例如固件不支持）没有数据，不算过期
+            self._stale.add(source.key)
+        if source.optional:
+            _LOGGER.debug("数据源 %s 获取失败", source.key)
+        else:
+            _LOGGER.warning("数据源 %s 获取失败", source.key)
+
+    def _snapshot_value(self, source, now):
+        """快照中数据源解析后的结果；没有结果或过期超过 max_stale_age 时按缺失解析"""
+        if source.key in self._stale and now - self._fetched_at.get(source.key, now) > self._max_stale_age:
+            return source.parse(None)
+        parsed = self._results.get(source.key)
+        return source.parse(None) if parsed is None else parsed
 
     def _get_cpu_count_from_system_info(self, system_info):
         """从系统信息中获取CPU核心数"""
@@ -184,756 +703,914 @@ class OpenWrtDataUpdateCoordinator(DataUpdateCoordinator):
         
         return 1
 
+    async def _async_check_breaker(self):
+        """熔断器打开时：未到探测时间直接失败；到时间后只发送一个探测请求，成功则恢复完整轮询"""
+        if self._breaker_until is None:
+            return
+        now = time.monotonic()
+        if now < self._breaker_until:
+            raise UpdateFailed(f"{self.host} 不可达，{round(self._breaker_until - now)} 秒后重试")
+        if await self._post(BREAKER_PROBE, probe=True) is None:
+            self._breaker_backoff = min(self._breaker_backoff * 2, BREAKER_MAX_BACKOFF)
+            self._breaker_until = time.monotonic() + self._breaker_backoff
+            raise UpdateFailed(f"{self.host} 不可达，{self._breaker_backoff} 秒后重试")
+
+    async def _gather_until(self, deadline, coros):
+        """并行执行 coros，到达截止时间后取消未完成的任务
+
+        返回 (results, timed_out)：未完成或出错的任务结果为 None，timed_out 标记哪些被取消。
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        if not tasks:
+            return [], []
+        _done, pending = await asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0))
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for task in tasks:
+            if task in pending:
+                results.append(None)
+            elif task.exception() is not None:
+                _LOGGER.debug("轮询任务出错: %s", task.exception())
+                results.append(None)
+            else:
+                results.append(task.result())
+        return results, [task in pending for task in tasks]
+
+    def is_expired(self):
+        """刷新失败（例如熔断器打开）且最近一次成功获取已超过 max_stale_age
+
+        失败的刷新不会发布新数据，_snapshot_value 的过期规则无法生效，由实体据此判断可用性。
+        """
+        if self.last_update_success:
+            return False
+        if not self._fetched_at:
+            return True
+        return time.monotonic() - max(self._fetched_at.values()) > self._max_stale_age
+
+    def is_stale(self, key):
+        """data 中的键在最近一次刷新中是否未能更新（超时或失败）"""
+        freshness = (self.data or {}).get("freshness") or {}
+        return bool(freshness.get(key, {}).get("stale"))
+
     async def _async_update_data(self):
         """更新数据 - 针对OpenWrt 24.10+优化"""
+        await self._async_check_breaker()
         try:
-            # 并行调用多个Ubus API - OpenWrt 24.10+支持的接口
-            tasks = [
-                # 系统信息
-                self._ubus_call("system", "board"),
-                self._ubus_call("system", "info"),
-                self._ubus_call("system", "processes"),
-                self._ubus_call("system", "uptime"),
-                self._ubus_call("system", "load"),
-                self._ubus_call("system", "memory"),
-                self._ubus_call("system", "swap"),
-                self._ubus_call("system", "cpu"),
-                
-                # 网络信息
-                self._ubus_call("network.interface", "dump"),
-                self._ubus_call("network.device", "status"),
-                self._ubus_call("network.wireless", "status"),
-                self._ubus_call("network", "status"),
-                
-                # 服务信息
-                self._ubus_call("service", "list"),
-                self._ubus_call("service", "running"),
-                
-                # 系统状态
-                self._ubus_call("log", "read"),
-                self._ubus_call("ubus", "list"),
-                
-                # OpenWrt 24.10+ 新增接口
-                self._ubus_call("system", "led"),
-                self._ubus_call("system", "watchdog"),
-                self._ubus_call("system", "sysupgrade"),
-                self._ubus_call("system", "upgrade"),
-                
-                # 网络高级功能
-                self._ubus_call("network", "dump"),
-                self._ubus_call("network", "reload"),
-                self._ubus_call("network.interface", "status"),
-                self._ubus_call("network.device", "dump"),
-                
-                # 防火墙和DHCP
-                self._ubus_call("firewall", "status"),
-                self._ubus_call("firewall", "dump"),
-                self._ubus_call("dhcp", "status"),
-                self._ubus_call("dhcp", "leases"),
-                
-                # 无线高级功能
-                self._ubus_call("network.wireless", "dump"),
-                self._ubus_call("network.wireless", "reload"),
-                
-                # 系统监控
-                self._ubus_call("system", "monitor"),
-                self._ubus_call("system", "stats"),
-            
-                # 尝试获取 UCI 中的 wireless 配置（用于获取 SSID/mode 等静态配置）
-                self._ubus_call("uci", "get_all", {"config": "wireless"}),
-                self._ubus_call("uci", "get", {"config": "wireless"}),
-                self._ubus_call("uci", "show", {"package": "wireless"}),
-                # LuCI RPC: 获取 DHCP 租约清单（用于更可靠的租约列表）
-                self._ubus_call("luci-rpc", "getDHCPLeases"),
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 处理结果
-            data = {}
-            
-            # system.board
-            if isinstance(results[0], dict):
-                data["system_board"] = results[0]
-            else:
-                data["system_board"] = {}
-            
-            # system.info
-            if isinstance(results[1], dict):
-                data["system_info"] = results[1]
-                # 处理内存数据，转换为MB
-                if "memory" in results[1]:
-                    memory = results[1]["memory"]
-                    data["memory"] = {
-                        "total_mb": self._convert_bytes_to_mb(memory.get("total", 0)),
-                        "free_mb": self._convert_bytes_to_mb(memory.get("free", 0)),
-                        "shared_mb": self._convert_bytes_to_mb(memory.get("shared", 0)),
-                        "buffered_mb": self._convert_bytes_to_mb(memory.get("buffered", 0)),
-                        "available_mb": self._convert_bytes_to_mb(memory.get("available", 0)),
-                        "cached_mb": self._convert_bytes_to_mb(memory.get("cached", 0))
-                    }
-                
-                # 处理CPU负载，转换为百分比
-                if "load" in results[1]:
-                    load = results[1]["load"]
-                    data["load"] = [
-                        self._calculate_cpu_load_percentage(load[0]) if len(load) > 0 else 0,
-                        self._calculate_cpu_load_percentage(load[1]) if len(load) > 1 else 0,
-                        self._calculate_cpu_load_percentage(load[2]) if len(load) > 2 else 0
-                    ]
-                
-                # 处理运行时间
-                if "uptime" in results[1]:
-                    data["uptime"] = {
-                        "seconds": results[1]["uptime"]
-                    }
-                
-                # 处理根文件系统
-                if "root" in results[1]:
-                    data["rootfs"] = results[1]["root"]
-                
-                # 处理临时文件系统
-                if "tmp" in results[1]:
-                    data["tmpfs"] = results[1]["tmp"]
-                
-                # 处理交换分区
-                if "swap" in results[1]:
-                    data["swap"] = results[1]["swap"]
-            else:
-                data["system_info"] = {}
-                data["memory"] = {}
-                data["load"] = [0, 0, 0]
-                data["uptime"] = {"seconds": 0}
-                data["rootfs"] = {}
-                data["tmpfs"] = {}
-                data["swap"] = {}
-            
-            # system.processes
-            if isinstance(results[2], dict):
-                data["processes"] = results[2]
-            else:
-                data["processes"] = {}
-            
-            # system.uptime
-            if isinstance(results[3], dict):
-                data["system_uptime"] = results[3]
-            else:
-                data["system_uptime"] = {}
-            
-            # system.load
-            if isinstance(results[4], dict):
-                data["system_load"] = results[4]
-            else:
-                data["system_load"] = {}
-            
-            # system.memory
-            if isinstance(results[5], dict):
-                data["system_memory"] = results[5]
-            else:
-                data["system_memory"] = {}
-            
-            # system.swap
-            if isinstance(results[6], dict):
-                data["system_swap"] = results[6]
-            else:
-                data["system_swap"] = {}
-            
-            # system.cpu
-            if isinstance(results[7], dict):
-                data["system_cpu"] = results[7]
-            else:
-                data["system_cpu"] = {}
-            
-            # network.interface.dump
-            if isinstance(results[8], dict) and "interface" in results[8]:
-                data["interfaces"] = {}
-                for iface in results[8]["interface"]:
-                    iface_name = iface.get("interface", "unknown")
-                    data["interfaces"][iface_name] = iface
-            else:
-                data["interfaces"] = {}
-            
-            # network.device.status
-            if isinstance(results[9], dict):
-                data["devices"] = results[9]
-            else:
-                data["devices"] = {}
-            
-            # network.wireless.status
-            if isinstance(results[10], dict):
-                data["wireless"] = results[10]
-            else:
-                data["wireless"] = {}
-            
-            # network.status
-            if isinstance(results[11], dict):
-                data["network_status"] = results[11]
-            else:
-                data["network_status"] = {}
-            
-            # service.list
-            if isinstance(results[12], dict):
-                data["services"] = results[12]
-            else:
-                data["services"] = {}
-            
-            # service.running
-            if isinstance(results[13], dict):
-                data["running_services"] = results[13]
-            else:
-                data["running_services"] = {}
-            
-            # log.read
-            if isinstance(results[14], dict):
-                data["logs"] = results[14]
-            else:
-                data["logs"] = {}
-            
-            # ubus.list
-            if isinstance(results[15], dict):
-                data["ubus_services"] = results[15]
-            else:
-                data["ubus_services"] = {}
-            
-            # OpenWrt 24.10+ 新增功能
-            # system.led
-            if isinstance(results[16], dict):
-                data["leds"] = results[16]
-            else:
-                data["leds"] = {}
-            
-            # system.watchdog
-            if isinstance(results[17], dict):
-                data["watchdog"] = results[17]
-            else:
-                data["watchdog"] = {}
-            
-            # system.sysupgrade
-            if isinstance(results[18], dict):
-                data["sysupgrade"] = results[18]
-            else:
-                data["sysupgrade"] = {}
-            
-            # system.upgrade
-            if isinstance(results[19], dict):
-                data["upgrade"] = results[19]
-            else:
-                data["upgrade"] = {}
-            
-            # network.dump
-            if isinstance(results[20], dict):
-                data["network_dump"] = results[20]
-            else:
-                data["network_dump"] = {}
-            
-            # network.reload
-            if isinstance(results[21], dict):
-                data["network_reload"] = results[21]
-            else:
-                data["network_reload"] = {}
-            
-            # network.interface.status
-            if isinstance(results[22], dict):
-                data["interface_status"] = results[22]
-            else:
-                data["interface_status"] = {}
-            
-            # network.device.dump
-            if isinstance(results[23], dict):
-                data["device_dump"] = results[23]
-            else:
-                data["device_dump"] = {}
-            
-            # firewall.status
-            if isinstance(results[24], dict):
-                data["firewall_status"] = results[24]
-            else:
-                data["firewall_status"] = {}
-            
-            # firewall.dump
-            if isinstance(results[25], dict):
-                data["firewall_dump"] = results[25]
-            else:
-                data["firewall_dump"] = {}
-            
-            # dhcp.status
-            if isinstance(results[26], dict):
-                data["dhcp_status"] = results[26]
-            else:
-                data["dhcp_status"] = {}
-            
-            # dhcp.leases
-            if isinstance(results[27], dict):
-                data["dhcp_leases"] = results[27]
-            else:
-                data["dhcp_leases"] = {}
-            
-            # network.wireless.dump
-            if isinstance(results[28], dict):
-                data["wireless_dump"] = results[28]
-            else:
-                data["wireless_dump"] = {}
-            
-            # network.wireless.reload
-            if isinstance(results[29], dict):
-                data["wireless_reload"] = results[29]
-            else:
-                data["wireless_reload"] = {}
-            
-            # system.monitor
-            if isinstance(results[30], dict):
-                data["system_monitor"] = results[30]
-            else:
-                data["system_monitor"] = {}
-            
-            # system.stats
-            if isinstance(results[31], dict):
-                data["system_stats"] = results[31]
-            else:
-                data["system_stats"] = {}
+            # 整个刷新共享一个时间预算，到时未完成的调用被取消，发布已有的结果；
+            # 单次调用的阶段只能用到 batch_deadline，剩余的时间留给依赖其结果的复合数据源
+            start = time.monotonic()
+            deadline = start + self._poll_timeout
+            batch_deadline = deadline - self._poll_timeout * COMPOSITE_BUDGET_SHARE
 
-            # 解析可能存在的 UCI wireless 配置（不依赖固定索引）
+            # 按需刷新 ubus 能力表，已知不存在的方法不会再被请求
             try:
-                wireless_config = {}
-                for res in results:
-                    if not isinstance(res, dict):
-                        continue
-                    # UCI 风格调用通常返回包含 'values' 的字典
-                    values = res.get("values") if isinstance(res.get("values"), dict) else None
-                    if not values:
-                        continue
+                await asyncio.wait_for(self._async_refresh_capabilities(), max(batch_deadline - start, 0))
+            except asyncio.TimeoutError:
+                _LOGGER.debug("获取 ubus 能力表超时")
+            self._poll_cycle += 1
 
-                    # 判断是否包含 wifi-device / wifi-iface 条目
-                    has_wifi = False
-                    for k, v in values.items():
-                        if isinstance(v, dict) and v.get(".type") in ("wifi-device", "wifi-iface"):
-                            has_wifi = True
-                            break
-                    if not has_wifi:
-                        continue
+            # 只请求到期的数据源（通过 JSON-RPC 批量请求），结果合并进持久快照；
+            # 耗时的数据源单独请求，避免拖住其它数据源
+            now = time.monotonic()
+            due = [source for source in self._sources if self._is_due(source, now)]
+            calls = [source for source in due if not source.fetcher]
+            groups = [group for group in [[s for s in calls if not s.heavy]] + [[s] for s in calls if s.heavy] if group]
+            fetched, timed_out = await self._gather_until(
+                batch_deadline,
+                [self._ubus_batch([(s.namespace, s.method, s.params) for s in group]) for group in groups],
+            )
+            for group, results, late in zip(groups, fetched, timed_out):
+                for source, result in zip(group, results or [None] * len(group)):
+                    self._store_result(source, result, now, timed_out=late)
+
+            # 由注册表中各数据源的 parser 组装数据，未到期的数据源使用快照中的结果
+            data = {}
+            origin = {}
+            for source in self._sources:
+                if not source.fetcher:
+                    parsed = self._snapshot_value(source, now)
+                    data.update(parsed)
+                    origin.update(dict.fromkeys(parsed, source.key))
+
+            if not data.get("ubus_services_count") and self._capabilities:
+                # 标准固件没有 ubus.list，改用能力表中的对象数量
+                data["ubus_services_count"] = len(self._capabilities)
+
+            self._check_firmware(data.get("system_board"))
+            self._check_reboot((data.get("uptime") or {}).get("seconds"))
 
-                    # 将 values 中的 wifi 配置合并到 wireless_config
-                    for name, entry in values.items():
-                        if not isinstance(entry, dict):
-                            continue
-                        wireless_config[name] = entry
-
-                if wireless_config:
-                    data["wireless_config"] = wireless_config
-
-                    # 将 wifi-iface 条目映射到一个便捷的 by_name 索引
-                    data.setdefault("wireless_by_ifname", {})
-                    for name, entry in wireless_config.items():
-                        t = entry.get(".type")
-                        if t == "wifi-iface":
-                            # 可能的字段: device (radioX), ssid, mode, encryption
-                            dev = entry.get("device")
-                            ssid = entry.get("ssid")
-                            data["wireless_by_ifname"][name] = {
-                                "name": name,
-                                "device": dev,
-                                "ssid": ssid,
-                                **entry,
-                            }
-
-            except Exception:
-                # 不影响主流程
-                pass
-            
             # 计算CPU核心数
             data["cpu_count"] = self._get_cpu_count_from_system_info(data.get("system_board", {}))
             
-            # 如果 wireless 为空但 wireless_dump 有数据，尝试合并以提供无线信息
+            # 如果 wireless 为空但 wireless_dump 有数据，使用 dump 中的无线接口
             if not data.get("wireless") and data.get("wireless_dump"):
-                # 某些路由器将详细无线信息放在 dump 中，这里做一次简单合并
-                data["wireless"] = data.get("wireless_dump", {})
-
-            # 规范化 wireless 结构，保证每个 radio 对应 dict 且包含 interfaces 列表
-            try:
-                wireless_raw = data.get("wireless") or {}
-                wired = {}
-                if isinstance(wireless_raw, dict):
-                    for radio, radio_data in wireless_raw.items():
-                        # radio_data 可能为 dict 或 list，处理常见情况
-                        interfaces = []
-                        if isinstance(radio_data, dict):
-                            if "interfaces" in radio_data and isinstance(radio_data["interfaces"], list):
-                                interfaces = radio_data["interfaces"]
-                            else:
-                                # 有些固件直接把接口信息放在 radio_data 本身
-                                # 检查字段 ifname 或 name
-                                if "ifname" in radio_data or "name" in radio_data:
-                                    interfaces = [radio_data]
-                                else:
-                                    # 尝试把 dict 的 values 转为列表形式
-                                    for v in radio_data.values():
-                                        if isinstance(v, dict) and ("ifname" in v or "up" in v or "mode" in v):
-                                            interfaces.append(v)
-                        elif isinstance(radio_data, list):
-                            interfaces = radio_data
-
-                        # 清理 interfaces 中的键，确保每项是 dict
-                        cleaned = [i for i in interfaces if isinstance(i, dict)]
-                        if cleaned:
-                            wired[radio] = {"interfaces": cleaned}
-
-                # 使用规范化后的结构替换
-                if wired:
-                    data["wireless"] = wired
-
-            except Exception:
-                # 保守降级，不中断主流程
-                pass
+                data["wireless"] = data["wireless_dump"]
 
             # 构建按 ifname 的快速索引，方便 platform 使用真实接口名（匹配 LuCI）
-            data["wireless_by_ifname"] = {}
-            try:
-                for radio, radio_data in (data.get("wireless") or {}).items():
-                    for iface in radio_data.get("interfaces", []):
-                        if not isinstance(iface, dict):
-                            continue
-                        ifname = iface.get("ifname") or iface.get("name") or iface.get("device")
-                        if not ifname:
-                            # 有时接口名放在 "ifname" 内嵌或为 key，尽量尝试其他字段
-                            continue
-                        data["wireless_by_ifname"][ifname] = {**iface, "radio": radio}
-            except Exception:
-                pass
+            data["wireless_by_ifname"] = {
+                iface.ifname: iface for interfaces in (data.get("wireless") or {}).values() for iface in interfaces
+            }
 
-            # 尝试通过 hostapd 获取实时连接客户端（优先）
-            data["clients"] = {}
-            try:
-                # 根据 wireless_config 中的 wifi-iface 推断 hostapd 对象名
-                wireless_cfg = data.get("wireless_config") or {}
-                hostapd_objs = set()
-                for name, entry in wireless_cfg.items():
-                    if entry.get(".type") != "wifi-iface":
-                        continue
-                    dev = entry.get("device") or ""
-                    # 常见映射: radio0 -> phy0 -> hostapd.phy0-ap0
-                    idx = None
-                    if dev.startswith("radio") and dev[5:].isdigit():
-                        idx = dev[5:]
-                    if idx is not None:
-                        hostapd_objs.add(f"hostapd.phy{idx}-ap0")
-                        hostapd_objs.add(f"hostapd.phy{idx}")
-                    # 也尝试直接使用 device 名
-                    if dev:
-                        hostapd_objs.add(f"hostapd.{dev}")
-
-                # 如果 ubus 的 hostapd 顶层存在，尝试该对象
-                for obj in list(hostapd_objs):
-                    try:
-                        res = await self._ubus_call(obj, "get_clients")
-                        if res and isinstance(res, dict):
-                            clients = res.get("clients") or res.get("stations") or res.get("clients_list") or []
-                            # 将 client 列表分配到所有相关 iface names（保守做法）
-                            name_key = obj.split(".", 1)[-1]
-                            data["clients"][name_key] = clients
-                    except Exception:
-                        continue
-            except Exception:
-                pass
+            # 复合数据源依赖上面的结果，到期的几组并行获取
+            composite = [source for source in due if source.fetcher]
+            composite_results, timed_out = await self._gather_until(
+                deadline, [getattr(self, source.fetcher)(data) for source in composite]
+            )
+            for source, result, late in zip(composite, composite_results, timed_out):
+                self._store_result(source, result, now, timed_out=late)
+            for source in self._sources:
+                if source.fetcher:
+                    parsed = self._snapshot_value(source, now)
+                    data.update(parsed)
+                    origin.update(dict.fromkeys(parsed, source.key))
 
-            # 汇总客户端数量
-            total_clients = 0
-            try:
-                for k, v in data.get("clients", {}).items():
+            # 每个键的来源数据源、最近一次成功获取时间以及是否过期，供实体判断如何显示
+            data["freshness"] = {
+                key: {
+                    "source": source_key,
+                    "updated": self._fetched_wall.get(source_key),
+                    "stale": source_key in self._stale,
+                }
+                for key, source_key in origin.items()
+            }
+
+            # 计算速率：只有 network.device 在本周期成功刷新时才产生新的样本
+            data["rates"] = self._calculate_rates(data.get("devices"), self._fetched_at.get("devices"))
+
+            self._async_save_cache()
+
+            if self._events is not None:
+                self._events.sync(self._event_objects())
+
+            _LOGGER.debug("数据更新完成: %s", list(data.keys()))
+            return data
+            
+        except Exception as e:
+            # 保留上次的数据，避免所有实体同时跳变为默认值
+            _LOGGER.error("更新数据时出错: %s", e)
+            return self.data or {}
+
+    async def _async_discover_wireless(self, snapshot):
+        """从能力表枚举 hostapd.* 对象，从 iwinfo.devices 获取无线设备"""
+        ifnames = sorted(snapshot.get("wireless_by_ifname") or {})
+        if self._capabilities is not None:
+            hostapd_objs = sorted(obj for obj in self._capabilities if obj.startswith("hostapd."))
+        else:
+            # 能力表不可用时按 hostapd 的命名规则（hostapd.<ifname>）推断
+            hostapd_objs = [f"hostapd.{ifname}" for ifname in ifnames]
+
+        devices = await self._ubus_call("iwinfo", "devices")
+        if isinstance(devices, dict) and isinstance(devices.get("devices"), list):
+            iwinfo_devices = sorted(str(dev) for dev in devices["devices"])
+        else:
+            iwinfo_devices = ifnames
+        return {"hostapd": hostapd_objs, "iwinfo": iwinfo_devices}
+
+    async def _fetch_clients(self, snapshot):
+        """通过 hostapd/iwinfo 获取无线客户端；hostapd 的原始客户端列表只在开启诊断时保留"""
+        clients = {}
+
+        # 发现结果随能力表一起过期；出现未知的无线接口时也重新发现
+        known = self._wireless_objects
+        if (
+            known is None
+            or time.monotonic() - self._wireless_objects_at >= CAPABILITY_TTL
+            or any(
+                ifname not in known["iwinfo"] and f"hostapd.{ifname}" not in known["hostapd"]
+                for ifname in snapshot.get("wireless_by_ifname") or {}
+            )
+        ):
+            self._wireless_objects = await self._async_discover_wireless(snapshot)
+            self._wireless_objects_at = time.monotonic()
+            _LOGGER.debug("发现无线对象: %s", self._wireless_objects)
+        hostapd_objs = self._wireless_objects["hostapd"]
+        iwinfo_devices = self._wireless_objects["iwinfo"]
+
+        # hostapd.get_clients 与 iwinfo.assoclist 在同一轮批量请求中并行获取
+        results = await self._ubus_batch(
+            [(obj, "get_clients", None) for obj in hostapd_objs]
+            + [("iwinfo", "assoclist", {"device": dev}) for dev in iwinfo_devices]
+        )
+        hostapd_results = results[:len(hostapd_objs)]
+        assoc_results = results[len(hostapd_objs):]
+        if results and all(res is None for res in results):
+            # 全部失败，由快照沿用上次的客户端统计
+            return None
+
+        # hostapd 实时连接客户端（优先）
+        for obj, res in zip(hostapd_objs, hostapd_results):
+            if res and isinstance(res, dict):
+                clients[obj.split(".", 1)[-1]] = res.get("clients") or res.get("stations") or res.get("clients_list") or []
+
+        # 按 MAC 合并 hostapd 与 iwinfo 的终端记录，并计算流量速率
+        radios = {ifname: iface.radio for ifname, iface in (snapshot.get("wireless_by_ifname") or {}).items()}
+        hostapd_stations = []
+        for obj, res in zip(hostapd_objs, hostapd_results):
+            ifname = obj.split(".", 1)[-1]
+            hostapd_stations.extend(parse_hostapd_clients(ifname, radios.get(ifname), res))
+        iwinfo_stations = []
+        for dev, res in zip(iwinfo_devices, assoc_results):
+            iwinfo_stations.extend(parse_iwinfo_assoclist(dev, radios.get(dev), res))
+        data = {"stations": self._stations.update(hostapd_stations, iwinfo_stations, time.monotonic())}
+        if self._raw is not None:
+            data["clients"] = clients
+
+        # 汇总客户端数量
+        data["clients_count"] = sum(
+            len(items) for items in clients.values() if isinstance(items, (list, dict))
+        )
+
+        # 使用 iwinfo assoclist 补充/验证无线客户端列表并统计
+        iw_clients_by_device = {}
+        for dev, res in zip(iwinfo_devices, assoc_results):
+            # 解析返回结构，兼容 dict/list
+            count = 0
+            if isinstance(res, dict):
+                # 有些实现返回 'assoclist' 或 'stations' 或 'results'
+                for v in res.values():
                     if isinstance(v, list):
-                        total_clients += len(v)
-                data["clients_count"] = total_clients
-            except Exception:
-                data["clients_count"] = 0
+                        count = len(v)
+                        break
+            elif isinstance(res, list):
+                count = len(res)
+            if count:
+                iw_clients_by_device[dev] = count
 
-            # 使用 iwinfo assoclist 补充/验证无线客户端列表并统计
-            try:
-                iw_clients_by_device = {}
-                devices_to_probe = set()
-                # 从 wireless_by_ifname 中收集可能的 device 名称
-                for ifname, entry in (data.get("wireless_by_ifname") or {}).items():
-                    dev = entry.get("device") or entry.get("ifname") or entry.get("name")
-                    if dev:
-                        devices_to_probe.add(dev)
-                        # 也尝试常见的 ap 后缀形式
-                        devices_to_probe.add(f"{dev}-ap0")
-
-                # 也包含已知的 clients 键（例如 hostapd 返回的 phy0-ap0）
-                for k in data.get("clients", {}).keys():
-                    devices_to_probe.add(k)
-
-                total_iw_clients = 0
-                for dev in devices_to_probe:
-                    try:
-                        res = await self._ubus_call("iwinfo", "assoclist", {"device": dev})
-                        if not res:
-                            continue
+        data["iw_clients_by_device"] = iw_clients_by_device
+        data["iw_clients_count"] = sum(iw_clients_by_device.values())
+        return data
 
-                        # 解析返回结构，兼容 dict/list
-                        count = 0
-                        if isinstance(res, dict):
-                            # 有些实现返回 'assoclist' 或 'stations' 或直接为列表字段
-                            if "assoclist" in res and isinstance(res["assoclist"], list):
-                                count = len(res["assoclist"])
-                            elif "stations" in res and isinstance(res["stations"], list):
-                                count = len(res["stations"])
-                            else:
-                                # 查找首个为 list 的字段
-                                for v in res.values():
-                                    if isinstance(v, list):
-                                        count = len(v)
-                                        break
-                        elif isinstance(res, list):
-                            count = len(res)
-
-                        if count:
-                            iw_clients_by_device[dev] = count
-                            total_iw_clients += count
-                    except Exception:
-                        continue
+    @staticmethod
+    def _parse_luci_leases(res):
+        """luci-rpc.getDHCPLeases: 统计不同的 IP 数量"""
+        leases = None
+        if isinstance(res, dict):
+            if "data" in res and isinstance(res["data"], list):
+                leases = res["data"]
+            elif "leases" in res and isinstance(res["leases"], list):
+                leases = res["leases"]
+            else:
+                vals = [v for v in res.values() if isinstance(v, (list, dict))]
+                if vals and isinstance(vals[0], list):
+                    leases = vals[0]
+        elif isinstance(res, list):
+            leases = res
+        if leases is None:
+            return None
 
-                data["iw_clients_by_device"] = iw_clients_by_device
-                data["iw_clients_count"] = total_iw_clients
-            except Exception:
-                data["iw_clients_by_device"] = {}
-                data["iw_clients_count"] = 0
+        seen_ips = set()
+        for item in leases:
+            if isinstance(item, str):
+                seen_ips.add(item)
+            elif isinstance(item, dict):
+                ips = [item[k] for k in ("ip", "ipaddr", "address", "ipv4", "ipv6", "lease") if isinstance(item.get(k), str) and item[k]]
+                if not ips:
+                    ips = [v for v in item.values() if isinstance(v, str) and ('.' in v or ':' in v)]
+                seen_ips.update(ips)
+        return len(seen_ips)
 
-            # 尝试通过多个可能的 ubus 接口获取 DHCP 租约数量
-            dhcp_count = None
-            try:
-                # 优先使用 LuCI RPC 返回的租约列表（如果可用）
+    @staticmethod
+    def _parse_ubus_leases(res):
+        """dhcp/dnsmasq/odhcpd 租约接口：{"leases": [...]}、odhcpd 的按接口分组或直接为列表"""
+        if isinstance(res, list):
+            return len(res)
+        if not isinstance(res, dict):
+            return None
+        if isinstance(res.get("leases"), list):
+            return len(res["leases"])
+        if isinstance(res.get("device"), dict):
+            # odhcpd ipv4leases: {"device": {"br-lan": {"leases": [...]}}}
+            return sum(
+                len(dev.get("leases") or []) for dev in res["device"].values() if isinstance(dev, dict)
+            )
+        for v in res.values():
+            if isinstance(v, list):
+                return len(v)
+        return None
+
+    @staticmethod
+    def _lease_file_content(res):
+        """file.read 的结果中取出文件内容"""
+        if isinstance(res, dict):
+            for key in ("stdout", "output", "data", "return"):
+                if isinstance(res.get(key), str):
+                    return res[key]
+        elif isinstance(res, str):
+            return res
+        return None
+
+    @classmethod
+    def _parse_lease_file(cls, res):
+        """file.read 读取的租约文件，每行一个租约"""
+        content = cls._lease_file_content(res)
+        if not content:
+            return None
+        lines = [line for line in content.splitlines() if line.strip()]
+        return len(lines) or None
+
+    def _dhcp_source_call(self, source):
+        """租约来源对应的 ubus 调用"""
+        if source.startswith("/"):
+            return ("file", "read", {"path": source})
+        namespace, method = source.rsplit(".", 1)
+        return (namespace, method, None)
+
+    def _dhcp_lease_data(self, source, res):
+        """按来源解析租约结果，返回要合并进 data 的键值；无法解析时返回 None"""
+        if source.startswith("/"):
+            count = self._parse_lease_file(res)
+            extra = {"dhcp_leases_source": source}
+        elif source == "luci-rpc.getDHCPLeases":
+            count = self._parse_luci_leases(res)
+            extra = {"dhcp_leases_raw": res} if self._raw is not None else {}
+        else:
+            count = self._parse_ubus_leases(res)
+            extra = {}
+        if count is None:
+            return None
+        return {"dhcp_leases_count": count, **extra}
+
+    def _parse_lease_records(self, source, res, now):
+        """按来源把租约结果解析为 Lease 列表，格式无法识别时返回 None"""
+        if source.startswith("/"):
+            return parse_lease_file(self._lease_file_content(res), now)
+        if source == "luci-rpc.getDHCPLeases":
+            return parse_luci_leases(res, now)
+        if isinstance(res, dict) and isinstance(res.get("device"), dict):
+            return parse_odhcpd_leases(res, now)
+        return parse_generic_leases(res, now)
+
+    def _apply_lease_table(self, source, res, data):
+        """增量更新租约表，把租约表与本轮差异放入 data；未变化时沿用同一个字典对象"""
+        now = time.time()
+        leases = self._parse_lease_records(source, res, now)
+        if leases is None:
+            return data
+        table = self._lease_table
+        if table.update(leases):
+            _LOGGER.debug(
+                "DHCP 租约变化: 新增 %d，续约 %d，过期 %d",
+                len(table.added), len(table.renewed), len(table.expired),
+            )
+        # 租约数按表中的 IPv4 租约计算；只有 IPv6 租约时保留原来的计数
+        ipv4 = table.count(4)
+        if ipv4 or not len(table):
+            data["dhcp_leases_count"] = ipv4
+        data["dhcp_lease_table"] = table.data
+        data["dhcp_leases_by_mac"] = table.macs
+        data["dhcp_lease_changes"] = table.changes
+        return data
+
+    async def _async_detect_dhcp_source(self):
+        """依次检测全部租约来源（ubus 方法一次批量请求，没有租约时再读租约文件），返回 (来源, 结果)
+
+        可用但没有租约的来源（例如 dhcp.ipv4leases 返回 {"device": {}}）只作为备选，
+        后面的来源有租约时优先使用后者。
+        """
+        fallback = (None, None)
+        for group in (
+            [f"{ns}.{method}" for ns, method in DHCP_UBUS_SOURCES],
+            list(DHCP_LEASE_FILES),
+        ):
+            results = await self._ubus_batch([self._dhcp_source_call(source) for source in group])
+            for source, res in zip(group, results):
+                data = self._dhcp_lease_data(source, res) if res is not None else None
+                if data is None:
+                    continue
+                if data["dhcp_leases_count"]:
+                    return source, res
+                if fallback[0] is None:
+                    fallback = (source, res)
+        return fallback
+
+    async def _fetch_dhcp_leases(self, snapshot):
+        """获取 DHCP 租约数量：只轮询已确定可用的来源，定期或失败时重新检测"""
+        try:
+            source = self._dhcp_source
+            if source is not None and time.monotonic() - self._dhcp_source_at < DHCP_SOURCE_REVALIDATE:
+                if source == DHCP_SOURCE_NONE:
+                    return None
+                res = await self._ubus_call(*self._dhcp_source_call(source))
+                data = self._dhcp_lease_data(source, res)
+                if data is not None:
+                    return self._apply_lease_table(source, res, data)
+                _LOGGER.debug("DHCP 租约来源 %s 失效，重新检测", source)
+
+            source, res = await self._async_detect_dhcp_source()
+            if source != self._dhcp_source:
+                _LOGGER.debug("DHCP 租约来源: %s", source)
+            self._dhcp_source_at = time.monotonic()
+            if source is None:
+                # 所有来源都失败，由快照沿用上次的租约数；路由器有应答时记住检测结果，
+                # 到重新检测之前不再逐个请求；传输失败时下个周期重新检测
+                self._dhcp_source = DHCP_SOURCE_NONE if not self._transport_failures else None
+                return None
+            self._dhcp_source = source
+            return self._apply_lease_table(source, res, self._dhcp_lease_data(source, res))
+        except Exception as e:
+            _LOGGER.debug("获取 DHCP 租约失败: %s", e)
+            return None
+
+    async def _async_discover_sensors(self):
+        """通过 file.list 发现 hwmon/thermal 下的全部温度输入，file.list 不可用时回退为探测 hwmon0..31"""
+        inputs = []
+        hwmon_list, thermal_list = await self._ubus_batch([
+            ("file", "list", {"path": "/sys/class/hwmon"}),
+            ("file", "list", {"path": "/sys/class/thermal"}),
+        ])
+
+        if hwmon_list is None and thermal_list is None:
+            probe_calls = []
+            for idx in range(HWMON_PROBE_COUNT):
+                probe_calls.append(("file", "read", {"path": f"/sys/class/hwmon/hwmon{idx}/temp1_input"}))
+                probe_calls.append(("file", "read", {"path": f"/sys/class/hwmon/hwmon{idx}/name"}))
+            probe_reads = await self._ubus_batch(probe_calls)
+            for idx in range(HWMON_PROBE_COUNT):
+                tmp, name = probe_reads[idx * 2], probe_reads[idx * 2 + 1]
+                if not isinstance(tmp, dict):
+                    continue
+                label = (name.get("data", "").strip() if isinstance(name, dict) else "") or f"thermal_zone{idx}"
+                inputs.append(self._sensor_input(label, idx, f"/sys/class/hwmon/hwmon{idx}/temp1_input"))
+            return inputs
+
+        def _entry_names(listing, prefix):
+            entries = listing.get("entries") if isinstance(listing, dict) else None
+            return sorted(
+                (entry.get("name") for entry in entries or [] if isinstance(entry, dict) and str(entry.get("name", "")).startswith(prefix)),
+                key=lambda name: int(name[len(prefix):]) if name[len(prefix):].isdigit() else 0,
+            )
+
+        hwmons = [name for name in _entry_names(hwmon_list, "hwmon") if name[5:].isdigit()]
+        zones = [name for name in _entry_names(thermal_list, "thermal_zone") if name[12:].isdigit()]
+
+        # 第二轮：列出每个 hwmon 目录，同时读取 hwmon 名称与 thermal_zone 类型
+        second = [("file", "list", {"path": f"/sys/class/hwmon/{hwmon}"}) for hwmon in hwmons]
+        second += [("file", "read", {"path": f"/sys/class/hwmon/{hwmon}/name"}) for hwmon in hwmons]
+        second += [("file", "read", {"path": f"/sys/class/thermal/{zone}/type"}) for zone in zones]
+        second_results = await self._ubus_batch(second)
+        listings = second_results[:len(hwmons)]
+        names = second_results[len(hwmons):len(hwmons) * 2]
+        zone_types = second_results[len(hwmons) * 2:]
+
+        # 第三轮：读取 tempN_label（只有存在的才读）
+        hwmon_temps = []
+        label_calls = []
+        for hwmon, listing in zip(hwmons, listings):
+            files = {entry.get("name") for entry in (listing or {}).get("entries", []) if isinstance(entry, dict)}
+            temps = sorted(
+                (name[4:-6] for name in files if name and name.startswith("temp") and name.endswith("_input") and name[4:-6].isdigit()),
+                key=int,
+            )
+            for channel in temps:
+                hwmon_temps.append((hwmon, channel))
+                if f"temp{channel}_label" in files:
+                    label_calls.append((hwmon, channel))
+        label_results = await self._ubus_batch(
+            [("file", "read", {"path": f"/sys/class/hwmon/{hwmon}/temp{channel}_label"}) for hwmon, channel in label_calls]
+        )
+        labels = {
+            key: res.get("data", "").strip()
+            for key, res in zip(label_calls, label_results)
+            if isinstance(res, dict) and res.get("data", "").strip()
+        }
+
+        hwmon_names = {
+            hwmon: (name.get("data", "").strip() if isinstance(name, dict) else "") or f"thermal_zone{hwmon[5:]}"
+            for hwmon, name in zip(hwmons, names)
+        }
+        for hwmon, channel in hwmon_temps:
+            idx = int(hwmon[5:])
+            hwmon_name = hwmon_names[hwmon]
+            path = f"/sys/class/hwmon/{hwmon}/temp{channel}_input"
+            if channel == "1":
+                # temp1 保持原有的键名与实体名称
+                inputs.append(self._sensor_input(hwmon_name, idx, path))
+            else:
+                label = labels.get((hwmon, channel)) or f"{hwmon_name} temp{channel}"
+                inputs.append(self._sensor_input(label, idx, path, suffix=f"temp{channel}"))
+
+        # thermal_zone 通常同时注册为 hwmon，名称相同的跳过以免重复
+        for zone, zone_type in zip(zones, zone_types):
+            label = (zone_type.get("data", "").strip() if isinstance(zone_type, dict) else "") or zone
+            if label.replace("-", "_") in {name.replace("-", "_") for name in hwmon_names.values()}:
+                continue
+            inputs.append(self._sensor_input(label, zone, f"/sys/class/thermal/{zone}/temp"))
+        return inputs
+
+    @staticmethod
+    def _sensor_input(label, zone, path, suffix=None):
+        key = f"{label.replace(' ', '_').replace('/', '_')}_{zone}"
+        if suffix:
+            key = f"{key}_{suffix}"
+        return {"key": key, "label": label, "zone": zone, "path": path}
+
+    async def _fetch_temperatures(self, snapshot):
+        """读取已发现的温度传感器，发现结果过期或路由器重启后重新发现"""
+        temperatures = {}
+        try:
+            if self._sensor_inputs is None or time.monotonic() - self._sensor_inputs_at >= SENSOR_DISCOVERY_INTERVAL:
+                self._sensor_inputs = await self._async_discover_sensors()
+                self._sensor_inputs_at = time.monotonic()
+                _LOGGER.debug("发现 %s 个温度传感器: %s", len(self._sensor_inputs), [i["path"] for i in self._sensor_inputs])
+
+            reads = await self._ubus_batch([("file", "read", {"path": i["path"]}) for i in self._sensor_inputs])
+            for sensor, res in zip(self._sensor_inputs, reads):
+                if not isinstance(res, dict):
+                    continue
+                temp_raw = res.get("data", "").strip()
                 try:
-                    luci_res = results[-1] if results else None
+                    # temperature usually in millidegrees
+                    celsius = round(int(temp_raw) / 1000.0, 2)
                 except Exception:
-                    luci_res = None
-
-                if luci_res:
-                    # 尝试解析 luci-rpc 返回的租约结构，兼容 dict/list 等多种格式
-                    leases = None
-                    if isinstance(luci_res, dict):
-                        if "data" in luci_res and isinstance(luci_res["data"], list):
-                            leases = luci_res["data"]
-                        elif "leases" in luci_res and isinstance(luci_res["leases"], list):
-                            leases = luci_res["leases"]
-                        else:
-                            vals = [v for v in luci_res.values() if isinstance(v, (list, dict))]
-                            if vals and isinstance(vals[0], list):
-                                leases = vals[0]
-                    elif isinstance(luci_res, list):
-                        leases = luci_res
-
-                    if leases is not None:
-                        seen_ips = set()
-                        for item in leases:
-                            ips = []
-                            if isinstance(item, str):
-                                ips.append(item)
-                            elif isinstance(item, dict):
-                                for k in ("ip", "ipaddr", "address", "ipv4", "ipv6", "lease"):
-                                    v = item.get(k) if isinstance(item.get(k), str) else None
-                                    if v:
-                                        ips.append(v)
-                                if not ips:
-                                    for v in item.values():
-                                        if isinstance(v, str) and ('.' in v or ':' in v):
-                                            ips.append(v)
-                            for ip in ips:
-                                if ip and ip not in seen_ips:
-                                    seen_ips.add(ip)
-                        dhcp_count = len(seen_ips)
-                        data["dhcp_leases_raw"] = luci_res
-
-                dhcp_candidates = [
-                    ("dhcp", "leases"),
-                    ("dhcp", "get_leases"),
-                    ("dnsmasq", "leases"),
-                    ("odhcpd", "leases"),
-                    ("dnsmasq", "get_leases"),
-                ]
-                for ns, method in dhcp_candidates:
                     try:
-                        res = await self._ubus_call(ns, method)
-                        if not res:
-                            continue
-
-                        # 常见结构：{"leases": [...] } 或直接为 list
-                        if isinstance(res, dict):
-                            # 直接包含 leases 字段
-                            if "leases" in res and isinstance(res["leases"], list):
-                                dhcp_count = len(res["leases"])
-                                break
-
-                            # 有时返回的字典中某个 value 就是租约列表
-                            found = False
-                            for v in res.values():
-                                if isinstance(v, list):
-                                    dhcp_count = len(v)
-                                    found = True
-                                    break
-                            if found:
-                                break
-
-                        elif isinstance(res, list):
-                            dhcp_count = len(res)
-                            break
+                        celsius = float(temp_raw)
                     except Exception:
                         continue
-            except Exception:
-                dhcp_count = None
+                temperatures[sensor["key"]] = Temperature(sensor["label"], sensor["zone"], celsius)
 
-            # 如果通过 ubus 未能获取到租约信息，回退为读取常见租约文件
-            if dhcp_count is None:
-                lease_files = ["/tmp/dhcp.leases", "/var/lib/misc/dnsmasq.leases", "/var/lib/dhcp/dhcpd.leases"]
-                for lf in lease_files:
-                    try:
-                        _LOGGER.debug("尝试通过 file.exec 读取租约文件: %s", lf)
-                        res = await self._ubus_call("file", "exec", {"command": "cat", "params": [lf]})
-                        # 处理多种可能的返回结构
-                        content = None
-                        if res is None:
-                            continue
-                        if isinstance(res, dict):
-                            # 常见情况下执行结果可能放在 stdout / output / data 字段
-                            for key in ("stdout", "output", "data", "return"):
-                                if key in res and isinstance(res[key], str):
-                                    content = res[key]
-                                    break
-                            # 有些实现直接把文本作为 values 的某个字段
-                            if content is None:
-                                for v in res.values():
-                                    if isinstance(v, str) and " " in v:
-                                        content = v
-                                        break
-                        elif isinstance(res, str):
-                            content = res
-
-                        if not content:
-                            continue
+            if self._sensor_inputs and not temperatures:
+                # 已知的输入全部读取失败（例如驱动重新加载），下次重新发现，本次沿用上次的结果
+                self._sensor_inputs = None
+                return None
+        except Exception as e:
+            _LOGGER.debug("Error reading temperature sensors: %s", e)
 
-                        # 解析 lease 文件，每行一个租约；忽略空行
-                        lines = [l for l in content.splitlines() if l.strip()]
-                        if lines:
-                            dhcp_count = len(lines)
-                            data["dhcp_leases_source"] = lf
-                            _LOGGER.debug("从租约文件 %s 解析到 %s 条租约", lf, dhcp_count)
-                            break
-                    except Exception as e:
-                        _LOGGER.debug("读取租约文件 %s 失败: %s", lf, e)
+        return {"temperatures": temperatures}
 
-            data["dhcp_leases_count"] = dhcp_count if dhcp_count is not None else 0
+    async def _fetch_logs(self, snapshot):
+        """增量读取系统日志：只请求末尾若干行，按游标去掉已经读过的行"""
+        tail = self._log_tail
+        res = await self._ubus_call("log", "read", log_read_params(tail.lines))
+        entries = parse_log_entries(res)
+        if entries is None:
+            return None
+        added = tail.update(entries)
+        if added:
+            _LOGGER.debug("读取到 %s 行新日志（窗口 %s 行）", added, tail.lines)
+        # 缓冲区的行数很快就会到达上限，log_count 为本次启动以来累计读取到的行数，而不是缓冲区的行数
+        return {"logs": tail.records, "log_count": tail.total}
 
-            # 读取所有 thermal_zone 温度（通过 ubus file read），自动发现任意数量的 thermal_zoneN
-            temperatures = {}
-            try:
-                async def _read_zone(idx: int):
-                    path_temp = f"/sys/class/hwmon/hwmon{idx}/temp1_input"
-                    path_type = f"/sys/class/hwmon/hwmon{idx}/name"
-                    try:
-                        tmp = await self._ubus_call("file", "read", {"path": path_temp})
-                        if not tmp or not isinstance(tmp, dict):
-                            return None
-                        temp_raw = tmp.get("data", "").strip()
-                        t = await self._ubus_call("file", "read", {"path": path_type})
-                        type_name = None
-                        if t and isinstance(t, dict):
-                            type_name = t.get("data", "").strip()
-                        return (idx, type_name or f"thermal_zone{idx}", temp_raw)
-                    except Exception:
-                        return None
+    async def _fetch_connections(self, snapshot):
+        """读取 nf_conntrack 连接数"""
+        connections = {}
+        try:
+            # 直接读取绝对路径的 nf_conntrack_count 和 nf_conntrack_max
+            path_count = "/proc/sys/net/netfilter/nf_conntrack_count"
+            path_max = "/proc/sys/net/netfilter/nf_conntrack_max"
 
-                # probe a reasonable range of possible zones (0..31)
-                zone_tasks = [_read_zone(i) for i in range(0, 32)]
-                zone_results = await asyncio.gather(*zone_tasks, return_exceptions=True)
-                for res in zone_results:
-                    if not res or isinstance(res, Exception):
-                        continue
-                    idx, name, temp_raw = res
-                    try:
-                        # temperature usually in millidegrees
-                        val = int(temp_raw)
-                        celsius = round(val / 1000.0, 2)
-                    except Exception:
-                        try:
-                            celsius = float(temp_raw)
-                        except Exception:
-                            continue
-                    label = (name or f"thermal_zone{idx}").replace(" ", "_").replace("/", "_")
-                    key = f"{label}_{idx}"
-                    temperatures[key] = {
-                        "label": name,
-                        "celsius": celsius,
-                        "raw": temp_raw,
-                        "zone": idx
-                    }
-            except Exception as e:
-                _LOGGER.debug("Error probing thermal zones: %s", e)
+            tmp, t = await self._ubus_batch([
+                ("file", "read", {"path": path_count}),
+                ("file", "read", {"path": path_max}),
+            ])
 
-            data["temperatures"] = temperatures
-            
-            connections = {}
-            try:
-                # 直接读取绝对路径的 nf_conntrack_count 和 nf_conntrack_max
-                path_count = "/proc/sys/net/netfilter/nf_conntrack_count"
-                path_max = "/proc/sys/net/netfilter/nf_conntrack_max"
+            # 这个读出来的就是一个直接的数值
+            count_val = None
+            max_val = None
 
-                tmp = await self._ubus_call("file", "read", {"path": path_count})
-                t = await self._ubus_call("file", "read", {"path": path_max})
+            if tmp and isinstance(tmp, dict):
+                try:
+                    count_val = int(tmp.get("data", "").strip())
+                except Exception:
+                    count_val = None
 
-                # 这个读出来的就是一个直接的数值
-                count_val = None
-                max_val = None
+            if t and isinstance(t, dict):
+                try:
+                    max_val = int(t.get("data", "").strip())
+                except Exception:
+                    max_val = None
 
-                if tmp and isinstance(tmp, dict):
-                    try:
-                        count_val = int(tmp.get("data", "").strip())
-                    except Exception:
-                        count_val = None
+            if count_val is None and max_val is None:
+                return None
 
-                if t and isinstance(t, dict):
-                    try:
-                        max_val = int(t.get("data", "").strip())
-                    except Exception:
-                        max_val = None
+            connections["nf_conntrack"] = {
+                "count": count_val,
+                "max": max_val,
+            }
+        except Exception as e:
+            _LOGGER.debug("Error reading nf_conntrack: %s", e)
 
-                connections["nf_conntrack"] = {
-                    "count": count_val,
-                    "max": max_val,
-                }
-            except Exception as e:
-                _LOGGER.debug("Error reading nf_conntrack: %s", e)
+        return {"connections": connections}
 
-            data["connections"] = connections
-            # 计算速率（如果有之前的数据）
-            if self._previous_data:
-                data["rates"] = self._calculate_rates(data, self._previous_data)
-            
-            self._previous_data = data.copy()
-            
-            _LOGGER.debug("数据更新完成: %s", list(data.keys()))
-            return data
-            
-        except Exception as e:
-            _LOGGER.error("更新数据时出错: %s", e)
-            return {}
+    def _calculate_rates(self, devices, stamp):
+        """根据 network.device 统计计算每个设备的速率（每秒）
+
+        stamp 为统计数据的获取时间（monotonic）。计数器变小时，只有 32 位回绕说得通才按回绕处理；
+        否则视为计数器被重置（接口重建等），该设备本次不输出速率，只重新记录基准。
+        """
+        if not isinstance(devices, dict) or stamp is None:
+            return self._rates
 
-    def _calculate_rates(self, current_data, previous_data):
-        """计算速率"""
         rates = {}
-        
-        # 计算网络接口速率
-        if "interfaces" in current_data and "interfaces" in previous_data:
-            for iface_name, iface_data in current_data["interfaces"].items():
-                if iface_name in previous_data["interfaces"]:
-                    prev_iface = previous_data["interfaces"][iface_name]
-                    # 这里可以添加速率计算逻辑
-                    pass
-        
+        counters = {}
+        for dev, dev_data in devices.items():
+            stats = getattr(dev_data, "statistics", None)
+            if not isinstance(stats, dict):
+                continue
+            current = {name: stats[name] for name in RATE_COUNTERS if isinstance(stats.get(name), int)}
+            counters[dev] = (stamp, current)
+
+            previous = self._counters.get(dev)
+            if previous is None:
+                continue
+            prev_stamp, prev_values = previous
+            if stamp <= prev_stamp:
+                # 没有新的样本，沿用上次的速率
+                if dev in self._rates:
+                    rates[dev] = self._rates[dev]
+                counters[dev] = previous
+                continue
+
+            elapsed = stamp - prev_stamp
+            dev_rates = {}
+            for name, value in current.items():
+                prev_value = prev_values.get(name)
+                if prev_value is None:
+                    continue
+                delta = value - prev_value
+                if delta < 0:
+                    half = COUNTER_WRAP_32 // 2
+                    wrapped = value + COUNTER_WRAP_32 - prev_value
+                    if half <= prev_value < COUNTER_WRAP_32 and value < half and wrapped < half:
+                        delta = wrapped
+                    else:
+                        # 接口重建后其它计数器也从零开始，整个设备本次都不输出速率
+                        _LOGGER.debug("设备 %s 的计数器 %s 被重置 (%s -> %s)", dev, name, prev_value, value)
+                        dev_rates = {}
+                        break
+                dev_rates[name] = round(delta / elapsed, 2)
+            if dev_rates:
+                dev_rates["interval"] = round(elapsed, 2)
+                rates[dev] = dev_rates
+
+        self._counters = counters
+        self._rates = rates
         return rates
 
+    def _cache_facts(self):
+        """需要持久化的静态事实"""
+        return {
+            "protocol": self._protocol,
+            "batch_supported": self._batch_supported,
+            "firmware": list(self._firmware) if self._firmware else None,
+            "capabilities": (
+                {obj: sorted(methods) for obj, methods in self._capabilities.items()}
+                if self._capabilities is not None else None
+            ),
+            "system_board": (self._results.get("system_board") or {}).get("system_board"),
+            "sensor_inputs": self._sensor_inputs,
+            "wireless_objects": self._wireless_objects,
+            "dhcp_source": self._dhcp_source,
+        }
+
+    async def async_load_cache(self):
+        """从持久缓存恢复静态事实；恢复后首次刷新不再重新发现"""
+        try:
+            cached = await self._store.async_load()
+        except Exception as e:
+            _LOGGER.debug("读取缓存失败: %s", e)
+            return
+        if not isinstance(cached, dict):
+            return
+
+        now = time.monotonic()
+        self._protocol = cached.get("protocol")
+        self._batch_supported = cached.get("batch_supported")
+        if cached.get("firmware"):
+            self._firmware = tuple(cached["firmware"])
+        if isinstance(cached.get("capabilities"), dict):
+            self._capabilities = {obj: set(methods) for obj, methods in cached["capabilities"].items()}
+            self._capabilities_at = now
+        if isinstance(cached.get("system_board"), dict):
+            # 仍会在首次刷新中重新获取，这里只作为获取失败时的后备
+            self._results["system_board"] = {"system_board": cached["system_board"]}
+        if isinstance(cached.get("sensor_inputs"), list):
+            self._sensor_inputs = cached["sensor_inputs"]
+            self._sensor_inputs_at = now
+        if isinstance(cached.get("wireless_objects"), dict):
+            self._wireless_objects = cached["wireless_objects"]
+            self._wireless_objects_at = now
+        self._dhcp_source = cached.get("dhcp_source")
+        self._dhcp_source_at = now
+        self._cached_facts = cached
+        self.cache_loaded = True
+        _LOGGER.debug("已从缓存恢复 %s 的静态信息", self.host)
+
+    def _async_save_cache(self):
+        """静态事实变化时延迟写入持久缓存"""
+        facts = self._cache_facts()
+        if facts == self._cached_facts:
+            return
+        self._cached_facts = facts
+        self._store.async_delay_save(lambda: facts, CACHE_SAVE_DELAY)
+
+    async def async_refresh_discovery(self):
+        """后台重新获取能力表并重新发现传感器与无线对象（用缓存启动后调用）"""
+        try:
+            await self._async_refresh_capabilities(force=True)
+            self._sensor_inputs = await self._async_discover_sensors()
+            self._sensor_inputs_at = time.monotonic()
+            self._wireless_objects = await self._async_discover_wireless(self.data or {})
+            self._wireless_objects_at = time.monotonic()
+            self._async_save_cache()
+            _LOGGER.debug("后台发现完成: %s 个传感器, 无线对象 %s", len(self._sensor_inputs), self._wireless_objects)
+        except Exception as e:
+            _LOGGER.debug("后台发现失败: %s", e)
+
+    def _changed_keys(self, previous, data):
+        """对比两次快照的顶层键，返回值发生变化的键（同一对象直接视为未变化）"""
+        changed = set()
+        for key in previous.keys() | data.keys():
+            if key in CHANGE_IGNORED_KEYS:
+                continue
+            old, new = previous.get(key), data.get(key)
+            if old is not new and old != new:
+                changed.add(key)
+        return changed
+
+    def async_update_listeners(self):
+        """只通知输入发生变化的监听器
+
+        实体注册监听器时以 frozenset 形式的上下文声明自己读取的数据键，只有这些键变化时才会被唤醒；
+        没有声明上下文的监听器（平台级监听器等）每次都会收到通知。
+        首次通知或刷新成功/失败状态变化时通知全部监听器，以便实体更新可用状态。
+        """
+        data = self.data or {}
+        previous = self._notified_data
+        success_changed = self._notified_success is not None and self._notified_success != self.last_update_success
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+        changed = None if previous is None or success_changed else self._changed_keys(previous, data)
+        self.changed_keys = changed
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is not None and isinstance(context, frozenset) and not context & changed:
+                self._notify_stats["skipped"] += 1
+                continue
+            self._notify_stats["notified"] += 1
+            update_callback()
+
+    def _event_objects(self):
+        """要订阅的 ubus 对象：已发现的 hostapd.* 对象优先，其次是 network.interface"""
+        objects = list((self._wireless_objects or {}).get("hostapd") or [])
+        if "network.interface" in (self._capabilities or {}):
+            objects.append("network.interface")
+        return objects
+
+    def _events_changed(self):
+        """让出订阅占用的 uhttpd 名额；终端事件全部有订阅时放慢完整轮询，否则恢复"""
+        streams = len(self._events.connected)
+        limit = max(1, min(self._max_concurrent, UHTTPD_MAX_REQUESTS - streams))
+        if limit != self._scheduler.limit:
+            _LOGGER.debug("%s 个事件订阅占用 uhttpd 名额，轮询并发数调整为 %s", streams, limit)
+            self._scheduler.set_limit(limit)
+        # 终端只能靠 hostapd 事件跟上变化：每个 hostapd 对象都有订阅时才放慢轮询，
+        # 只订阅到部分对象或只有 network.interface 时终端表仍按正常间隔轮询
+        hostapd = (self._wireless_objects or {}).get("hostapd") or []
+        covered = bool(hostapd) and all(obj in self._events.connected for obj in hostapd)
+        interval = self._scan_interval * EVENT_POLL_FACTOR if covered else self._scan_interval
+        if interval != self.update_interval:
+            _LOGGER.debug("事件订阅 %s，轮询间隔调整为 %s", sorted(self._events.connected), interval)
+            self.update_interval = interval
+
+    def _patch_source(self, key, parsed):
+        """用事件修补数据源解析后的快照并立即通知实体，不等待下一次轮询"""
+        if not any(source.key == key for source in self._sources) or not self.data:
+            return
+        self._results[key] = parsed
+        wall = time.time()
+        freshness = dict(self.data.get("freshness") or {})
+        freshness.update({name: {"source": key, "updated": wall, "stale": False} for name in parsed})
+        self.data = {**self.data, **parsed, "freshness": freshness}
+        self.async_update_listeners()
+
+    def _handle_event(self, obj, event, payload):
+        """处理订阅收到的 ubus 通知"""
+        if obj.startswith("hostapd."):
+            self._handle_station_event(obj.split(".", 1)[-1], event, payload)
+        elif obj == "network.interface":
+            self._handle_interface_event(event, payload)
+
+    def _handle_station_event(self, ifname, event, payload):
+        """终端关联/断开：增删终端表中的条目，信号、速率等指标在下一轮轮询中获取"""
+        mac = normalize_mac(payload.get("address"))
+        current = self._results.get("clients")
+        if not mac or not isinstance(current, dict):
+            return
+        stations = dict(current.get("stations") or {})
+        if event in STATION_JOIN_EVENTS:
+            if mac in stations:
+                return
+            iface = ((self.data or {}).get("wireless_by_ifname") or {}).get(ifname)
+            stations[mac] = Station(mac, ifname, iface.radio if iface is not None else None)
+        elif event in STATION_LEAVE_EVENTS:
+            station = stations.pop(mac, None)
+            if station is None:
+                return
+            ifname = station.ifname
+        else:
+            return
+        _LOGGER.debug("事件: 终端 %s %s (%s)", mac, event, ifname)
+        patch = {"stations": stations, "clients_count": len(stations)}
+        if "iw_clients_count" in current:
+            # WiFi Clients 传感器优先读取 iwinfo 的统计，同步调整所在接口的计数
+            by_device = dict(current.get("iw_clients_by_device") or {})
+            count = by_device.get(ifname, 0) + (1 if event in STATION_JOIN_EVENTS else -1)
+            if count > 0:
+                by_device[ifname] = count
+            else:
+                by_device.pop(ifname, None)
+            patch["iw_clients_by_device"] = by_device
+            patch["iw_clients_count"] = sum(by_device.values())
+        # 下一轮轮询重新获取终端列表；保留获取时间，max_stale_age 仍按上次成功获取计算
+        self._due_now.add("clients")
+        self._patch_source("clients", {**current, **patch})
+
+    def _handle_interface_event(self, event, payload):
+        """netifd 的 interface.update / interface.down：更新接口的 up 状态与状态信息"""
+        name = payload.get("interface")
+        interfaces = (self._results.get("interfaces") or {}).get("interfaces")
+        if not name or not isinstance(interfaces, dict) or name not in interfaces:
+            return
+        if event == "interface.down":
+            fields = {"up": False}
+        elif event == "interface.update":
+            fields = interface_fields(payload)
+        else:
+            return
+        _LOGGER.debug("事件: 接口 %s %s", name, event)
+        self._patch_source("interfaces", {"interfaces": {**interfaces, name: replace(interfaces[name], **fields)}})
+
+    def get_diagnostics(self):
+        """返回连接相关的诊断信息"""
+        return {
+            "connection": {
+                "protocol": self._protocol,
+                "url": self.url,
+                "transport_failures": self._transport_failures,
+                "breaker_open": self._breaker_until is not None,
+                "breaker_retry_in": round(max(self._breaker_until - time.monotonic(), 0)) if self._breaker_until is not None else None,
+                "breaker_backoff": self._breaker_backoff,
+                "batch_supported": self._batch_supported,
+                "logged_in": self.session_id is not None,
+                "session_expires_in": round(self._session_expires_at - time.monotonic()) if self.session_id else None,
+                "session_timeout": self._session_timeout,
+                "relogins": self._relogins,
+            },
+            "capabilities": {
+                "objects": sorted(self._capabilities) if self._capabilities is not None else None,
+                "age": round(time.monotonic() - self._capabilities_at) if self._capabilities is not None else None,
+                "unsupported": sorted(f"{ns}.{method}" for ns, method in self._unsupported),
+                "denied": sorted(f"{ns}.{method}" for ns, method in self._denied),
+                "firmware": self._firmware,
+            },
+            "scheduler": self._scheduler.stats(),
+            "listeners": {
+                **self._notify_stats,
+                "changed_keys": sorted(self.changed_keys) if self.changed_keys is not None else None,
+            },
+            "poll": {
+                "timeout": self._poll_timeout,
+                "max_stale_age": self._max_stale_age,
+                "stale_sources": sorted(self._stale),
+                "source_age": {
+                    key: round(time.monotonic() - fetched_at) for key, fetched_at in sorted(self._fetched_at.items())
+                },
+            },
+            "wireless_objects": self._wireless_objects,
+            "dhcp_source": self._dhcp_source,
+            "dhcp_leases": {"count": len(self._lease_table), "version": self._lease_table.version},
+            "stations": len(self._stations),
+            "logs": self._log_tail.stats(),
+            "cache_loaded": self.cache_loaded,
+            "events": self._events.stats() if self._events is not None else None,
+            "raw": self._raw,
+            "sensors": {
+                "inputs": [sensor["path"] for sensor in self._sensor_inputs] if self._sensor_inputs is not None else None,
+                "age": round(time.monotonic() - self._sensor_inputs_at) if self._sensor_inputs is not None else None,
+            },
+            "readonly_poll": {
+                "refused": sorted(f"{ns}.{method}" for (ns, method), allowed in self._poll_allowed.items() if not allowed),
+                "verified": sorted(
+                    f"{ns}.{method}" for (ns, method), allowed in self._poll_allowed.items()
+                    if allowed and method not in READONLY_UBUS_METHODS
+                ),
+            },
+        }
+
     async def async_close(self):
         """关闭连接"""
+        if self._events is not None:
+            await self._events.async_stop()
         if self._session:
             await self._session.close()
 
-    async def call_ubus(self, namespace: str, method: str, params: dict | None = None):
-        """公共方法，供其他平台调用 ubus API（封装 _ubus_call）。返回调用结果或 None。"""
-        return await self._ubus_call(namespace, method, params)
+    async def call_ubus(self, namespace: str, method: str, params: dict | None = None, priority: str = PRIORITY_INTERACTIVE):
+        """公共方法，供开关/按钮/服务等显式操作调用 ubus API（封装 _ubus_call）。返回调用结果或 None。
+
+        与轮询不同，这里允许调用会修改路由器状态的方法；默认以交互优先级排在后台轮询请求之前。
+        """
+        return await self._ubus_call(namespace, method, params, readonly=False, priority=priority)
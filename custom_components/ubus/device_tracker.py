@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import time
+from homeassistant.components.device_tracker import ScannerEntity, SourceType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from .const import DOMAIN, CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OpenWrtPresence:
+    """Last-seen bookkeeping shared by all trackers of one router.
+
+    Presence comes from the coordinator's station table (associated
+    wireless clients); IP and hostname come from the DHCP lease table.
+    """
+
+    def __init__(self, consider_home: int):
+        self.consider_home = consider_home
+        self.last_seen: dict[str, float] = {}
+        self.stations: dict = {}
+        self.leases: dict = {}
+        self.lease_table: dict = {}
+
+    def update(self, data: dict) -> None:
+        stations = data.get("stations")
+        if isinstance(stations, dict):
+            self.stations = stations
+            # Use the time the station table was actually fetched: a carried-over
+            # snapshot must not refresh last_seen
+            fetched = ((data.get("freshness") or {}).get("stations") or {}).get("updated")
+            if fetched is not None:
+                for mac in stations:
+                    self.last_seen[mac] = max(self.last_seen.get(mac, 0), fetched)
+        self.leases = data.get("dhcp_leases_by_mac") or {}
+        self.lease_table = data.get("dhcp_lease_table") or {}
+
+    def is_home(self, mac: str) -> bool:
+        seen = self.last_seen.get(mac)
+        return seen is not None and time.time() - seen <= self.consider_home
+
+    def lease(self, mac: str) -> tuple[str | None, str | None]:
+        """(ip, hostname) for a MAC, preferring an IPv4 lease"""
+        ips = sorted(self.leases.get(mac) or [], key=lambda ip: ":" in ip)
+        if not ips:
+            return None, None
+        lease = self.lease_table.get(ips[0])
+        return ips[0], lease.hostname if lease is not None else None
+
+
+class OpenWrtDeviceTracker(ScannerEntity):
+    """Presence of a wireless client seen by the OpenWrt router"""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator, presence: OpenWrtPresence, mac: str):
+        self.coordinator = coordinator
+        self._presence = presence
+        self._mac = mac
+        self._attr_unique_id = f"{coordinator.host}_tracker_{mac}"
+        self._attr_name = presence.lease(mac)[1] or mac
+        # Snapshot of what was last written, used to skip redundant state writes
+        self._written = None
+
+    @property
+    def unique_id(self) -> str:
+        # ScannerEntity derives unique_id from the MAC; keep one tracker per router
+        # so a router and an AP seeing the same client do not collide
+        return self._attr_unique_id
+
+    @property
+    def available(self) -> bool:
+        # Without a fresh station table presence is unknown, not away
+        return self.coordinator.last_update_success and not self.coordinator.is_stale("stations")
+
+    @property
+    def source_type(self) -> SourceType:
+        return SourceType.ROUTER
+
+    @property
+    def is_connected(self) -> bool:
+        return self._presence.is_home(self._mac)
+
+    @property
+    def mac_address(self) -> str:
+        return self._mac
+
+    @property
+    def ip_address(self) -> str | None:
+        return self._presence.lease(self._mac)[0]
+
+    @property
+    def hostname(self) -> str | None:
+        return self._presence.lease(self._mac)[1]
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        station = self._presence.stations.get(self._mac)
+        if station is None:
+            return {}
+        return {"interface": station.ifname, "radio": station.radio}
+
+    def _state_key(self):
+        station = self._presence.stations.get(self._mac)
+        return (
+            self.available,
+            self.is_connected,
+            self._presence.lease(self._mac),
+            (station.ifname, station.radio) if station is not None else None,
+        )
+
+    def async_write_if_changed(self) -> bool:
+        """Write state only when availability, presence (or the lease/AP shown with it) changed"""
+        key = self._state_key()
+        if key == self._written or self.hass is None:
+            return False
+        self._written = key
+        self.async_write_ha_state()
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._written = self._state_key()
+
+
+async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddEntitiesCallback):
+    """Set up device trackers for wireless clients reported by the coordinator"""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    consider_home = {**entry.data, **entry.options}.get(CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME)
+    presence = OpenWrtPresence(consider_home)
+    trackers: dict[str, OpenWrtDeviceTracker] = {}
+
+    # Restore trackers registered in earlier runs, so clients that are away
+    # right now show up as not_home instead of disappearing
+    prefix = f"{coordinator.host}_tracker_"
+    registry = er.async_get(hass)
+    restored = [
+        reg_entry.unique_id[len(prefix):]
+        for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if reg_entry.domain == "device_tracker" and reg_entry.unique_id.startswith(prefix)
+    ]
+
+    def _sync(initial=False):
+        data = coordinator.data or {}
+        presence.update(data)
+        added = []
+        if initial:
+            for mac in restored:
+                if mac not in trackers:
+                    trackers[mac] = OpenWrtDeviceTracker(coordinator, presence, mac)
+                    added.append(trackers[mac])
+        for mac in presence.stations:
+            if mac not in trackers:
+                trackers[mac] = OpenWrtDeviceTracker(coordinator, presence, mac)
+                added.append(trackers[mac])
+        if added:
+            _LOGGER.debug("Adding %d OpenWrt device trackers", len(added))
+            async_add_entities(added)
+        if not initial:
+            changed = sum(tracker.async_write_if_changed() for tracker in trackers.values())
+            if changed:
+                _LOGGER.debug("Presence changed for %d OpenWrt device trackers", changed)
+
+    _sync(initial=True)
+
+    # One listener for the whole platform: trackers are not CoordinatorEntity
+    # subclasses, so a poll only writes state for MACs whose presence changed.
+    def _handle_coordinator_update():
+        try:
+            _sync()
+        except Exception as e:
+            _LOGGER.debug("Error while updating device trackers: %s", e)
+
+    entry.async_on_unload(coordinator.async_add_listener(_handle_coordinator_update))
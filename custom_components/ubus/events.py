@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# 订阅断开后的重连退避时间（秒），每次失败翻倍，直到上限
+EVENT_RECONNECT_BASE = 5
+EVENT_RECONNECT_MAX = 300
+
+# 每个订阅都会长期占用 uhttpd 的一个请求名额（max_requests 默认 3），且不经过请求调度器；
+# 最多订阅两个对象（network.interface 与一个 hostapd 对象），协调器相应降低轮询并发数
+EVENT_MAX_STREAMS = 2
+
+# uhttpd 不支持订阅或对象不存在时返回的状态码
+EVENT_UNSUPPORTED_STATUS = (400, 404, 501)
+
+
+class UbusEventStreams:
+    """通过 uhttpd-mod-ubus 的 /ubus/subscribe/<object>（SSE）接收 ubus 对象通知
+
+    每个对象一个长连接，收到的通知交给 handler(object, type, data)；
+    连接建立或断开时调用 on_change()，协调器据此调整完整轮询的间隔。
+    """
+
+    def __init__(self, coordinator, handler, on_change):
+        self._coordinator = coordinator
+        self._handler = handler
+        self._on_change = on_change
+        self._tasks = {}
+        self.connected = set()
+        self.unsupported = set()
+        self.events = 0
+
+    def sync(self, objects):
+        """为新出现的对象启动订阅，停止已不存在的对象的订阅"""
+        wanted = [obj for obj in objects if obj not in self.unsupported][:EVENT_MAX_STREAMS]
+        for obj in list(self._tasks):
+            if obj not in wanted:
+                self._tasks.pop(obj).cancel()
+        for obj in wanted:
+            if obj not in self._tasks:
+                self._tasks[obj] = asyncio.ensure_future(self._run(obj))
+
+    async def async_stop(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "subscribed": sorted(self._tasks),
+            "connected": sorted(self.connected),
+            "unsupported": sorted(self.unsupported),
+            "events": self.events,
+        }
+
+    async def _run(self, obj):
+        backoff = EVENT_RECONNECT_BASE
+        denied = False
+        while True:
+            status = None
+            try:
+                await self._coordinator._ensure_session()
+                status = await self._stream(obj)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.debug("订阅 %s 断开: %s", obj, e)
+            finally:
+                if obj in self.connected:
+                    self.connected.discard(obj)
+                    self._on_change()
+
+            if status in EVENT_UNSUPPORTED_STATUS or (status in (401, 403) and denied):
+                _LOGGER.debug("路由器不支持订阅 %s（HTTP %s），只依靠轮询", obj, status)
+                self.unsupported.add(obj)
+                self._tasks.pop(obj, None)
+                return
+            if status in (401, 403):
+                # 会话可能已失效：下次连接前重新登录，再被拒绝则认为 ACL 不允许订阅
+                denied = True
+                self._coordinator._session_expires_at = 0.0
+                continue
+            if status == 200:
+                backoff = EVENT_RECONNECT_BASE
+                denied = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, EVENT_RECONNECT_MAX)
+
+    async def _stream(self, obj):
+        """读取一个订阅直到连接关闭，返回 HTTP 状态码"""
+        coordinator = self._coordinator
+        async with coordinator._session.get(
+            f"{coordinator.url}/subscribe/{obj}",
+            headers={"Authorization": f"Bearer {coordinator.session_id}", "Accept": "text/event-stream"},
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10),
+        ) as resp:
+            if resp.status != 200:
+                return resp.status
+            self.connected.add(obj)
+            self._on_change()
+            _LOGGER.debug("已订阅 %s 的事件", obj)
+
+            event, lines = None, []
+            async for raw in resp.content:
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                if line:
+                    if line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:"):
+                        lines.append(line[5:].lstrip())
+                    continue
+                # 空行表示一条事件结束
+                if event and lines:
+                    self._dispatch(obj, event, "\n".join(lines))
+                event, lines = None, []
+            return resp.status
+
+    def _dispatch(self, obj, event, payload):
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            _LOGGER.debug("无法解析 %s 的事件 %s: %s", obj, event, payload)
+            return
+        self.events += 1
+        try:
+            self._handler(obj, event, data if isinstance(data, dict) else {})
+        except Exception as e:
+            _LOGGER.debug("处理 %s 的事件 %s 失败: %s", obj, event, e)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# 到期时间前移超过该秒数才算续约（剩余时间在不同轮询之间会有几秒的抖动）
+LEASE_RENEW_TOLERANCE = 30
+
+
+@dataclass(frozen=True, slots=True)
+class Lease:
+    """一条 DHCP 租约；expires 为到期的 epoch 秒数，None 表示永久/静态租约"""
+
+    ip: str
+    mac: str | None
+    hostname: str | None
+    expires: int | None
+    family: int
+
+    def as_dict(self) -> dict:
+        return {
+            "mac": self.mac,
+            "hostname": self.hostname,
+            "expires": self.expires,
+            "family": self.family,
+        }
+
+
+def normalize_mac(mac):
+    """统一为小写冒号分隔格式，odhcpd 返回的是不带分隔符的十六进制串"""
+    if not isinstance(mac, str) or not mac:
+        return None
+    mac = mac.strip().lower().replace("-", ":")
+    if ":" not in mac and len(mac) == 12:
+        mac = ":".join(mac[i:i + 2] for i in range(0, 12, 2))
+    return mac
+
+
+def _make_lease(ip, mac, hostname, remaining, now):
+    if not isinstance(ip, str) or not ip:
+        return None
+    ip = ip.split("/", 1)[0]
+    expires = None
+    if isinstance(remaining, (int, float)) and remaining >= 0:
+        expires = int(now + remaining)
+    if not hostname or hostname == "*":
+        hostname = None
+    return Lease(ip, normalize_mac(mac), hostname, expires, 6 if ":" in ip else 4)
+
+
+def parse_luci_leases(res, now):
+    """luci-rpc.getDHCPLeases: {"dhcp_leases": [...], "dhcp6_leases": [...]}，expires 为剩余秒数"""
+    if not isinstance(res, dict):
+        return None
+    leases = []
+    for item in res.get("dhcp_leases") or []:
+        if isinstance(item, dict):
+            leases.append(_make_lease(item.get("ipaddr"), item.get("macaddr"), item.get("hostname"), item.get("expires"), now))
+    for item in res.get("dhcp6_leases") or []:
+        if not isinstance(item, dict):
+            continue
+        addrs = item.get("ip6addrs") or [item.get("ip6addr")]
+        for addr in addrs:
+            leases.append(_make_lease(addr, item.get("macaddr"), item.get("hostname"), item.get("expires"), now))
+    return [lease for lease in leases if lease]
+
+
+def parse_odhcpd_leases(res, now):
+    """odhcpd dhcp.ipv4leases / ipv6leases: {"device": {ifname: {"leases": [...]}}}"""
+    devices = res.get("device") if isinstance(res, dict) else None
+    if not isinstance(devices, dict):
+        return None
+    leases = []
+    for dev in devices.values():
+        for item in (dev or {}).get("leases") or []:
+            if not isinstance(item, dict):
+                continue
+            if isinstance(item.get("ipv6-addr"), list):
+                for addr in item["ipv6-addr"]:
+                    if isinstance(addr, dict):
+                        leases.append(_make_lease(addr.get("address"), item.get("mac"), item.get("hostname"), item.get("valid"), now))
+            else:
+                leases.append(_make_lease(item.get("ip") or item.get("address"), item.get("mac"), item.get("hostname"), item.get("valid"), now))
+    return [lease for lease in leases if lease]
+
+
+def parse_lease_file(content, now):
+    """dnsmasq 租约文件：每行 "<到期 epoch> <mac> <ip> <主机名> <client-id>"，到期为 0 表示永久"""
+    if not isinstance(content, str):
+        return None
+    leases = []
+    for line in content.splitlines():
+        fields = line.split()
+        if len(fields) < 3 or not fields[0].isdigit():
+            continue
+        expiry = int(fields[0])
+        # DHCPv6 行的第二列是 IAID 而不是 MAC
+        mac = None if ":" in fields[2] else fields[1]
+        lease = _make_lease(fields[2], mac, fields[3] if len(fields) > 3 else None, None, now)
+        if lease:
+            if expiry:
+                lease = Lease(lease.ip, lease.mac, lease.hostname, expiry, lease.family)
+            leases.append(lease)
+    return leases
+
+
+def parse_generic_leases(res, now):
+    """其它租约接口：{"leases": [...]} 或直接为列表，字段名尽量兼容"""
+    items = res.get("leases") if isinstance(res, dict) else res
+    if not isinstance(items, list):
+        return None
+    leases = []
+    for item in items:
+        if isinstance(item, dict):
+            leases.append(_make_lease(
+                item.get("ipaddr") or item.get("ip") or item.get("address"),
+                item.get("macaddr") or item.get("mac"),
+                item.get("hostname") or item.get("name"),
+                item.get("expires") if "expires" in item else item.get("valid"),
+                now,
+            ))
+    return [lease for lease in leases if lease]
+
+
+class LeaseTable:
+    """按 IP 索引、带 MAC 反向索引的租约表，每次更新只处理变化的条目并给出差异"""
+
+    __slots__ = ("_leases", "_by_mac", "_data", "_macs", "version", "added", "renewed", "expired")
+
+    def __init__(self):
+        self._leases: dict[str, Lease] = {}
+        self._by_mac: dict[str | None, set[str]] = {}
+        self._data: dict[str, Lease] = {}
+        self._macs: dict[str, list[str]] = {}
+        self.version = 0
+        self.added: list[str] = []
+        self.renewed: list[str] = []
+        self.expired: list[str] = []
+
+    def __len__(self):
+        return len(self._leases)
+
+    def get(self, ip) -> Lease | None:
+        return self._leases.get(ip)
+
+    def by_mac(self, mac) -> list[Lease]:
+        return [self._leases[ip] for ip in self._by_mac.get(normalize_mac(mac), ())]
+
+    def _remove(self, data, ip):
+        lease = self._leases.pop(ip)
+        data.pop(ip, None)
+        ips = self._by_mac.get(lease.mac)
+        if ips is not None:
+            ips.discard(ip)
+            if not ips:
+                del self._by_mac[lease.mac]
+
+    def _put(self, data, lease):
+        self._leases[lease.ip] = lease
+        data[lease.ip] = lease
+        self._by_mac.setdefault(lease.mac, set()).add(lease.ip)
+
+    @staticmethod
+    def _same(current, lease):
+        """主机名不变且到期时间只是抖动（路由器按剩余秒数上报）时视为同一条租约"""
+        if current.mac != lease.mac or current.hostname != lease.hostname:
+            return False
+        if current.expires is None or lease.expires is None:
+            return current.expires == lease.expires
+        return abs(lease.expires - current.expires) <= LEASE_RENEW_TOLERANCE
+
+    def update(self, leases) -> bool:
+        """用本次获取的租约更新表，返回是否有变化；差异保存在 added/renewed/expired"""
+        added, renewed = [], []
+        seen = set()
+        # 路由器会自行清理过期租约，这里以其返回的列表为准，不与本机时钟比较
+        for lease in leases:
+            seen.add(lease.ip)
+            current = self._leases.get(lease.ip)
+            if current is None or current.mac != lease.mac:
+                added.append(lease)
+            elif not self._same(current, lease):
+                renewed.append(lease)
+        expired = [ip for ip in self._leases if ip not in seen]
+
+        if not (added or renewed or expired):
+            return False
+
+        # 在副本上修改后再发布，已经交给实体的字典不会被改动，未变化的条目沿用原有的值
+        data = dict(self._data)
+        for ip in expired:
+            self._remove(data, ip)
+        for lease in added:
+            if lease.ip in self._leases:
+                self._remove(data, lease.ip)
+            self._put(data, lease)
+        for lease in renewed:
+            self._put(data, lease)
+        self._data = data
+        self._macs = {mac: sorted(ips) for mac, ips in self._by_mac.items() if mac}
+        self.version += 1
+        self.added = [lease.ip for lease in added]
+        self.renewed = [lease.ip for lease in renewed]
+        self.expired = expired
+        return True
+
+    @property
+    def data(self) -> dict:
+        """{ip: Lease}，只在有变化时才替换为新的对象"""
+        return self._data
+
+    @property
+    def macs(self) -> dict:
+        """{mac: [ip, ...]}，同样只在有变化时重建"""
+        return self._macs
+
+    def count(self, family=None) -> int:
+        if family is None:
+            return len(self._leases)
+        return sum(1 for lease in self._leases.values() if lease.family == family)
+
+    @property
+    def changes(self) -> dict:
+        return {
+            "version": self.version,
+            "added": self.added,
+            "renewed": self.renewed,
+            "expired": self.expired,
+        }
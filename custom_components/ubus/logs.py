@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+# 环形缓冲区保留的日志行数与消息总字节数（UTF-8）上限，先到先淘汰
+LOG_RING_LINES = 500
+LOG_RING_BYTES = 64 * 1024
+
+# 单条日志保留的最大字符数
+LOG_MAX_MESSAGE = 512
+
+# 每次轮询读取的末尾行数；读到的行全部是新日志（中间可能有遗漏）时加倍，最多到环形缓冲区的行数
+LOG_TAIL_LINES = 100
+
+
+@dataclass(frozen=True, slots=True)
+class LogRecord:
+    """一行系统日志；time 为 epoch 秒，priority 为 syslog 的 facility|level"""
+
+    id: int | None
+    time: int | None
+    priority: int | None
+    source: int | None
+    msg: str
+
+
+def _int(value):
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _size(entry):
+    return len(entry.msg.encode("utf-8", "replace"))
+
+
+def log_read_params(lines):
+    """log.read 的参数；stream 默认为 true，会让 logd 保持连接等待新日志，必须关闭"""
+    return {"lines": lines, "stream": False, "oneshot": True}
+
+
+def parse_log_entries(res):
+    """log.read: {"log": [{id, msg, time, priority, source}]}，格式无法识别时返回 None"""
+    items = None
+    if isinstance(res, dict):
+        items = res.get("log") if isinstance(res.get("log"), list) else res.get("data")
+    elif isinstance(res, list):
+        items = res
+    if not isinstance(items, list):
+        return None
+    records = []
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("msg"), str):
+            continue
+        records.append(LogRecord(
+            _int(item.get("id")),
+            _int(item.get("time")),
+            _int(item.get("priority")),
+            _int(item.get("source")),
+            item["msg"][:LOG_MAX_MESSAGE],
+        ))
+    return records
+
+
+class LogTail:
+    """系统日志的增量读取状态：读取游标、读取窗口以及按行数和字节数限制的环形缓冲区
+
+    游标优先使用 logd 的日志序号；固件不返回序号时使用最后一行的时间，
+    同一秒内已读过的消息按内容去重。
+    """
+
+    __slots__ = ("_ring", "_bytes", "_records", "_last_id", "_last_time", "_last_msgs", "lines", "total", "gaps")
+
+    def __init__(self):
+        self._ring: deque[LogRecord] = deque()
+        self._bytes = 0
+        self._records: tuple[LogRecord, ...] = ()
+        self._last_id = None
+        self._last_time = None
+        self._last_msgs: set[str] = set()
+        self.lines = LOG_TAIL_LINES
+        self.total = 0
+        self.gaps = 0
+
+    def __len__(self):
+        return len(self._ring)
+
+    @property
+    def records(self) -> tuple:
+        """缓冲区中的日志，只在有新日志时才替换为新的对象"""
+        return self._records
+
+    def reset(self):
+        """路由器重启后日志重新开始，丢弃游标，下次读取的行全部视为新日志"""
+        self._last_id = None
+        self._last_time = None
+        self._last_msgs = set()
+        self.lines = LOG_TAIL_LINES
+
+    def _unread(self, entries):
+        """返回 (未读过的行, 窗口是否与已读部分衔接)"""
+        if self._last_id is None and self._last_time is None:
+            return entries, True
+        ids = [entry.id for entry in entries]
+        if self._last_id is not None and None not in ids:
+            if ids and max(ids) < self._last_id:
+                # 序号回退：logd 重新启动过
+                return entries, True
+            unread = [entry for entry in entries if entry.id > self._last_id]
+        else:
+            last = self._last_time or 0
+            unread = [
+                entry for entry in entries
+                if (entry.time or 0) > last or ((entry.time or 0) == last and entry.msg not in self._last_msgs)
+            ]
+        return unread, len(unread) < len(entries)
+
+    def update(self, entries) -> int:
+        """合并本次读取的末尾若干行，返回新增的行数"""
+        if not entries:
+            return 0
+        unread, joined = self._unread(entries)
+        if joined:
+            self.lines = max(LOG_TAIL_LINES, self.lines // 2)
+        else:
+            # 整个窗口都是新日志，两次读取之间可能还有更多，下次读取更多行
+            self.gaps += 1
+            self.lines = min(self.lines * 2, LOG_RING_LINES)
+        if not unread:
+            return 0
+
+        ring = self._ring
+        for entry in unread:
+            ring.append(entry)
+            self._bytes += _size(entry)
+        while len(ring) > LOG_RING_LINES or self._bytes > LOG_RING_BYTES:
+            self._bytes -= _size(ring.popleft())
+        self._records = tuple(ring)
+        self.total += len(unread)
+
+        newest = unread[-1]
+        self._last_id = newest.id
+        if newest.time != self._last_time:
+            self._last_msgs = set()
+        self._last_time = newest.time
+        self._last_msgs.update(entry.msg for entry in unread if entry.time == newest.time)
+        return len(unread)
+
+    def stats(self) -> dict:
+        return {
+            "lines": len(self._ring),
+            "bytes": self._bytes,
+            "window": self.lines,
+            "total": self.total,
+            "gaps": self.gaps,
+        }
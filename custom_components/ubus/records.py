@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Memory:
+    """system.info 中的内存，单位为 MB"""
+
+    total_mb: float = 0
+    free_mb: float = 0
+    shared_mb: float = 0
+    buffered_mb: float = 0
+    available_mb: float = 0
+    cached_mb: float = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Interface:
+    """netifd 的一个逻辑接口；地址只保留地址本身，不含掩码"""
+
+    name: str
+    up: bool | None = None
+    proto: str | None = None
+    uptime: int | None = None
+    device: str | None = None
+    l3_device: str | None = None
+    ipv4: tuple[str, ...] = ()
+    ipv6: tuple[str, ...] = ()
+    dns: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class NetDevice:
+    """network.device 中的一个设备；statistics 只保留参与速率计算的计数器"""
+
+    name: str
+    type: str | None = None
+    up: bool | None = None
+    mtu: int | None = None
+    statistics: dict | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WirelessInterface:
+    """network.wireless 中射频下的一个无线接口"""
+
+    ifname: str
+    radio: str
+    name: str | None = None
+    up: bool | None = None
+    mode: str | None = None
+    ssid: str | None = None
+    device: str | None = None
+    channel: int | str | None = None
+    txpower: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Temperature:
+    """一个 sysfs 温度输入的读数"""
+
+    label: str
+    zone: str | None
+    celsius: float
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import math
+import time
+
+# 请求优先级：交互操作（开关/按钮/服务）优先于后台轮询
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND)
+
+
+class _LaneStats:
+    """单个优先级的排队等待时间与总耗时（等待 + 请求）统计"""
+
+    def __init__(self):
+        self.requests = 0
+        self.queued = 0
+        self.max_depth = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.recent = collections.deque(maxlen=100)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, wait):
+        self.requests += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.recent.append(wait)
+
+    def as_dict(self, depth):
+        recent = sorted(self.recent)
+        return {
+            "queue_depth": depth,
+            "max_queue_depth": self.max_depth,
+            "requests": self.requests,
+            "queued_requests": self.queued,
+            "wait_avg_ms": round(self.wait_total / self.requests * 1000, 1) if self.requests else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 1),
+            "wait_p95_ms": round(recent[math.ceil(len(recent) * 0.95) - 1] * 1000, 1) if recent else 0.0,
+            "latency_avg_ms": round(self.latency_total / self.requests * 1000, 1) if self.requests else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 1),
+        }
+
+
+class RequestScheduler:
+    """每个路由器一个的请求调度器
+
+    uhttpd 同时处理的请求数很少（max_requests 默认 3），超出的请求会排队或被拒绝。
+    这里限制同时发往路由器的请求数，其余请求按优先级排队（同一优先级内先进先出），
+    空出的名额总是先交给交互请求，并按优先级分别记录队列深度与等待时间。
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self._active = 0
+        self._waiters = {priority: collections.deque() for priority in PRIORITIES}
+        self._stats = {priority: _LaneStats() for priority in PRIORITIES}
+
+    @property
+    def depth(self) -> int:
+        """当前排队中的请求数"""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: str = PRIORITY_BACKGROUND):
+        """占用一个并发名额，退出时释放给优先级最高的排队请求"""
+        start = time.monotonic()
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+            stats = self._stats[priority]
+            latency = time.monotonic() - start
+            stats.latency_total += latency
+            stats.latency_max = max(stats.latency_max, latency)
+
+    async def _acquire(self, priority):
+        start = time.monotonic()
+        stats = self._stats[priority]
+        if self._active < self.limit and not self.depth:
+            self._active += 1
+        else:
+            waiters = self._waiters[priority]
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            stats.queued += 1
+            stats.max_depth = max(stats.max_depth, len(waiters))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # 名额已经交给了本请求，转交给下一个
+                    self._release()
+                elif waiter in waiters:
+                    # _release() 可能已经弹出了这个被取消的 future
+                    waiters.remove(waiter)
+                raise
+        stats.record(time.monotonic() - start)
+
+    def set_limit(self, limit: int):
+        """调整并发上限：调高时立即唤醒排队的请求，调低时由正在进行的请求结束后逐步收回"""
+        self.limit = max(1, int(limit))
+        while self._active < self.limit and self._wake():
+            self._active += 1
+
+    def _wake(self):
+        """把名额交给优先级最高的队首请求，没有可唤醒的请求时返回 False"""
+        for priority in PRIORITIES:
+            waiters = self._waiters[priority]
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return True
+        return False
+
+    def _release(self):
+        # 名额直接交给优先级最高的队首请求，并发数不变；超出上限（上限被调低）时收回名额
+        if self._active <= self.limit and self._wake():
+            return
+        self._active -= 1
+
+    def stats(self) -> dict:
+        """调度器统计信息（等待时间单位为毫秒）"""
+        return {
+            "limit": self.limit,
+            "active": self._active,
+            "queue_depth": self.depth,
+            **{priority: self._stats[priority].as_dict(len(self._waiters[priority])) for priority in PRIORITIES},
+        }
@@ -1,4 +1,4 @@
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import (
     UnitOfDataRate, UnitOfInformation, UnitOfTemperature,
@@ -6,6 +6,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.entity import EntityCategory
 from .const import DOMAIN
+from .values import ValuePath, active_inactive, up_down, yes_no
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,19 +41,20 @@ def get_led_icon():
 def get_watchdog_icon():
     return "mdi:dog-service"
 
-def get_upgrade_icon():
-    return "mdi:update"
-
 def get_firewall_icon():
     return "mdi:shield-check"
 
 class OpenWrtSensor(CoordinatorEntity, SensorEntity):
     """OpenWrt传感器实体"""
 
-    def __init__(self, coordinator, name, value_fn, unit=None, icon=None, state_class=None, device_class=None, entity_category=None):
-        super().__init__(coordinator)
+    def __init__(self, coordinator, name, value: ValuePath, unit=None, icon=None, state_class=None, device_class=None, entity_category=None):
+        # 只在路径依赖的数据键变化时才被协调器唤醒
+        super().__init__(coordinator, context=value.keys)
         self._name = f"{name}"
-        self._value_fn = value_fn
+        self._value = value
+        # 同一路由器的全部传感器共用一个取值缓存，每个快照只批量计算一次
+        self._values = coordinator.sensor_values
+        self._values.register(self, value)
         self._unit = unit
         self._attr_unique_id = f"{coordinator.host}_{name.lower().replace(' ', '_')}"
         self._attr_name = self._name
@@ -81,16 +83,16 @@ class OpenWrtSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """获取传感器值"""
-        try:
-            return self._value_fn(self.coordinator.data)
-        except Exception as e:
-            _LOGGER.warning("Error getting value for %s: %s", self._name, e)
-            return None
+        return self._values.get(self.coordinator.data, self)
+
+    async def async_will_remove_from_hass(self):
+        await super().async_will_remove_from_hass()
+        self._values.unregister(self)
 
     @property
     def available(self):
-        """检查传感器是否可用"""
-        return self.coordinator.data is not None
+        """检查传感器是否可用：刷新持续失败、数据超过 max_stale_age 后不再显示旧值"""
+        return self.coordinator.data is not None and not self.coordinator.is_expired()
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """设置OpenWrt传感器 - 针对OpenWrt 24.10+优化"""
@@ -107,55 +109,55 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     entities.extend([
         OpenWrtSensor(
             coordinator, "Hostname", 
-            lambda d: d.get("system_board", {}).get("hostname", "N/A"),
+            ValuePath(("system_board", "hostname"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Model", 
-            lambda d: d.get("system_board", {}).get("model", "N/A"),
+            ValuePath(("system_board", "model"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Version", 
-            lambda d: d.get("system_board", {}).get("release", {}).get("version", "N/A"),
+            ValuePath(("system_board", "release", "version"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Description", 
-            lambda d: d.get("system_board", {}).get("release", {}).get("description", "N/A"),
+            ValuePath(("system_board", "release", "description"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Distribution", 
-            lambda d: d.get("system_board", {}).get("release", {}).get("distribution", "N/A"),
+            ValuePath(("system_board", "release", "distribution"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Revision", 
-            lambda d: d.get("system_board", {}).get("release", {}).get("revision", "N/A"),
+            ValuePath(("system_board", "release", "revision"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Target", 
-            lambda d: d.get("system_board", {}).get("release", {}).get("target", "N/A"),
+            ValuePath(("system_board", "release", "target"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "Architecture", 
-            lambda d: d.get("system_board", {}).get("system", "N/A"),
+            ValuePath(("system_board", "system"), default="N/A"),
             icon=get_system_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
         OpenWrtSensor(
             coordinator, "CPU Cores", 
-            lambda d: d.get("cpu_count", 1),
+            ValuePath(("cpu_count",), default=1),
             icon=get_cpu_icon(),
             state_class=SensorStateClass.MEASUREMENT,
             entity_category=EntityCategory.DIAGNOSTIC,
@@ -166,7 +168,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     if data.get("uptime"):
         entities.append(OpenWrtSensor(
             coordinator, "Uptime", 
-            lambda d: d.get("uptime", {}).get("seconds", 0),
+            ValuePath(("uptime", "seconds"), default=0),
             unit=UnitOfTime.SECONDS,
             icon=get_time_icon(),
             state_class=SensorStateClass.TOTAL_INCREASING
@@ -177,21 +179,21 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.extend([
             OpenWrtSensor(
                 coordinator, "CPU Load 1min", 
-                lambda d: d.get("load", [0, 0, 0])[0],
+                ValuePath(("load", 0), default=0),
                 unit=PERCENTAGE,
                 icon=get_cpu_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "CPU Load 5min", 
-                lambda d: d.get("load", [0, 0, 0])[1],
+                ValuePath(("load", 1), default=0),
                 unit=PERCENTAGE,
                 icon=get_cpu_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "CPU Load 15min", 
-                lambda d: d.get("load", [0, 0, 0])[2],
+                ValuePath(("load", 2), default=0),
                 unit=PERCENTAGE,
                 icon=get_cpu_icon(),
                 state_class=SensorStateClass.MEASUREMENT
@@ -203,42 +205,42 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.extend([
             OpenWrtSensor(
                 coordinator, "Memory Total", 
-                lambda d: d.get("memory", {}).get("total_mb", 0),
+                ValuePath(("memory", "total_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "Memory Free", 
-                lambda d: d.get("memory", {}).get("free_mb", 0),
+                ValuePath(("memory", "free_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "Memory Available", 
-                lambda d: d.get("memory", {}).get("available_mb", 0),
+                ValuePath(("memory", "available_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "Memory Cached", 
-                lambda d: d.get("memory", {}).get("cached_mb", 0),
+                ValuePath(("memory", "cached_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "Memory Buffered", 
-                lambda d: d.get("memory", {}).get("buffered_mb", 0),
+                ValuePath(("memory", "buffered_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "Memory Shared", 
-                lambda d: d.get("memory", {}).get("shared_mb", 0),
+                ValuePath(("memory", "shared_mb"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_memory_icon(),
                 state_class=SensorStateClass.MEASUREMENT
@@ -250,21 +252,21 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.extend([
             OpenWrtSensor(
                 coordinator, "RootFS Total", 
-                lambda d: d.get("rootfs", {}).get("total", 0),
+                ValuePath(("rootfs", "total"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_system_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "RootFS Free", 
-                lambda d: d.get("rootfs", {}).get("free", 0),
+                ValuePath(("rootfs", "free"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_system_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "RootFS Used", 
-                lambda d: d.get("rootfs", {}).get("used", 0),
+                ValuePath(("rootfs", "used"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_system_icon(),
                 state_class=SensorStateClass.MEASUREMENT
@@ -275,14 +277,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.extend([
             OpenWrtSensor(
                 coordinator, "TmpFS Total", 
-                lambda d: d.get("tmpfs", {}).get("total", 0),
+                ValuePath(("tmpfs", "total"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_system_icon(),
                 state_class=SensorStateClass.MEASUREMENT
             ),
             OpenWrtSensor(
                 coordinator, "TmpFS Free", 
-                lambda d: d.get("tmpfs", {}).get("free", 0),
+                ValuePath(("tmpfs", "free"), default=0),
                 unit=UnitOfInformation.MEGABYTES,
                 icon=get_system_icon(),
                 state_class=SensorStateClass.MEASUREMENT
@@ -298,14 +300,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 if isinstance(led_data, dict):
                     entities.append(OpenWrtSensor(
                         coordinator, f"LED {led_name.title()}", 
-                        lambda d, n=led_name: d.get("leds", {}).get(n, {}).get("status", "N/A"),
+                        ValuePath(("leds", led_name, "status"), default="N/A"),
                         icon=get_led_icon()
                     ))
                     # LED亮度
                     if "brightness" in led_data:
                         entities.append(OpenWrtSensor(
                             coordinator, f"LED {led_name.title()} Brightness", 
-                            lambda d, n=led_name: d.get("leds", {}).get(n, {}).get("brightness", 0),
+                            ValuePath(("leds", led_name, "brightness"), default=0),
                             unit=PERCENTAGE,
                             icon=get_led_icon(),
                             state_class=SensorStateClass.MEASUREMENT,
@@ -319,7 +321,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.append(OpenWrtSensor(
             coordinator,
             "Watchdog Status",
-            lambda d: d.get("watchdog", {}).get("status", "N/A"),
+            ValuePath(("watchdog", "status"), default="N/A"),
             icon=get_watchdog_icon(),
             entity_category=EntityCategory.DIAGNOSTIC,
         ))
@@ -327,7 +329,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         entities.append(OpenWrtSensor(
             coordinator,
             "Watchdog Timeout",
-            lambda d: d.get("watchdog", {}).get("timeout", 0),
+            ValuePath(("watchdog", "timeout"), default=0),
             unit=UnitOfTime.SECONDS,
             icon=get_watchdog_icon(),
             state_class=SensorStateClass.MEASUREMENT,
@@ -338,7 +340,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             entities.append(OpenWrtSensor(
                 coordinator,
                 "Watchdog Frequency",
-                lambda d: d.get("watchdog", {}).get("frequency", 0),
+                ValuePath(("watchdog", "frequency"), default=0),
                 unit=UnitOfTime.SECONDS,
                 icon=get_watchdog_icon(),
                 state_class=SensorStateClass.MEASUREMENT,
@@ -349,29 +351,11 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             entities.append(OpenWrtSensor(
                 coordinator,
                 "Watchdog Magicclose",
-                lambda d: "Yes" if d.get("watchdog", {}).get("magicclose", False) else "No",
+                ValuePath(("watchdog", "magicclose"), transform=yes_no),
                 icon=get_watchdog_icon(),
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
 
-    # 系统升级传感器
-    if data.get("sysupgrade"):
-        if isinstance(data["sysupgrade"], dict):
-            entities.append(OpenWrtSensor(
-                coordinator, "Sysupgrade Available", 
-                lambda d: "Yes" if d.get("sysupgrade", {}).get("available", False) else "No",
-                icon=get_upgrade_icon()
-            ))
-            entities.append(OpenWrtSensor(
-                coordinator, "Sysupgrade Version", 
-                lambda d: d.get("sysupgrade", {}).get("version", "N/A"),
-                icon=get_upgrade_icon()
-            ))
-
-            # mark sysupgrade info as diagnostic
-            entities[-2]._attr_entity_category = EntityCategory.DIAGNOSTIC
-            entities[-1]._attr_entity_category = EntityCategory.DIAGNOSTIC
-
     # 网络接口传感器
     if data.get("interfaces"):
         for iface, iface_data in data.get("interfaces", {}).items():
@@ -380,25 +364,25 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             # 接口状态
             entities.append(OpenWrtSensor(
                 coordinator, f"{iface_upper} Status", 
-                lambda d, i=iface: "Up" if d.get("interfaces", {}).get(i, {}).get("up", False) else "Down",
+                ValuePath(("interfaces", iface, "up"), transform=up_down),
                 icon=get_network_icon(),
                 entity_category=EntityCategory.DIAGNOSTIC,
             ))
             
             # 接口协议
-            if "proto" in iface_data:
+            if iface_data.proto is not None:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{iface_upper} Protocol", 
-                    lambda d, i=iface: d.get("interfaces", {}).get(i, {}).get("proto", "N/A"),
+                    ValuePath(("interfaces", iface, "proto"), default="N/A"),
                     icon=get_network_icon(),
                     entity_category=EntityCategory.DIAGNOSTIC,
                 ))
             
             # 接口运行时间
-            if "uptime" in iface_data:
+            if iface_data.uptime is not None:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{iface_upper} Uptime", 
-                    lambda d, i=iface: d.get("interfaces", {}).get(i, {}).get("uptime", 0),
+                    ValuePath(("interfaces", iface, "uptime"), default=0),
                     unit=UnitOfTime.SECONDS,
                     icon=get_network_icon(),
                     state_class=SensorStateClass.TOTAL_INCREASING,
@@ -406,31 +390,31 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 ))
             
             # IPv4地址
-            if "ipv4-address" in iface_data and iface_data["ipv4-address"]:
-                for i, addr in enumerate(iface_data["ipv4-address"]):
+            if iface_data.ipv4:
+                for i, addr in enumerate(iface_data.ipv4):
                     entities.append(OpenWrtSensor(
                         coordinator, f"{iface_upper} IPv4 {i+1}", 
-                        lambda d, i=iface, idx=i: d.get("interfaces", {}).get(i, {}).get("ipv4-address", [])[idx].get("address", "N/A") if len(d.get("interfaces", {}).get(i, {}).get("ipv4-address", [])) > idx else "N/A",
+                        ValuePath(("interfaces", iface, "ipv4", i), default="N/A"),
                         icon=get_network_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                     ))
             
             # IPv6地址
-            if "ipv6-address" in iface_data and iface_data["ipv6-address"]:
-                for i, addr in enumerate(iface_data["ipv6-address"]):
+            if iface_data.ipv6:
+                for i, addr in enumerate(iface_data.ipv6):
                     entities.append(OpenWrtSensor(
                         coordinator, f"{iface_upper} IPv6 {i+1}", 
-                        lambda d, i=iface, idx=i: d.get("interfaces", {}).get(i, {}).get("ipv6-address", [])[idx].get("address", "N/A") if len(d.get("interfaces", {}).get(i, {}).get("ipv6-address", [])) > idx else "N/A",
+                        ValuePath(("interfaces", iface, "ipv6", i), default="N/A"),
                         icon=get_network_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                     ))
             
             # DNS服务器
-            if "dns-server" in iface_data and iface_data["dns-server"]:
-                for i, dns in enumerate(iface_data["dns-server"]):
+            if iface_data.dns:
+                for i, dns in enumerate(iface_data.dns):
                     entities.append(OpenWrtSensor(
                         coordinator, f"{iface_upper} DNS {i+1}", 
-                        lambda d, i=iface, idx=i: d.get("interfaces", {}).get(i, {}).get("dns-server", [])[idx] if len(d.get("interfaces", {}).get(i, {}).get("dns-server", [])) > idx else "N/A",
+                        ValuePath(("interfaces", iface, "dns", i), default="N/A"),
                         icon=get_network_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                     ))
@@ -441,53 +425,63 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             dev_upper = dev.upper()
             
             # 设备类型
-            if "type" in dev_data:
+            if dev_data.type is not None:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{dev_upper} Type", 
-                    lambda d, n=dev: d.get("devices", {}).get(n, {}).get("type", "N/A"),
+                    ValuePath(("devices", dev, "type"), default="N/A"),
                     icon=get_network_icon()
                 ))
             
             # 设备状态
-            if "up" in dev_data:
+            if dev_data.up is not None:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{dev_upper} Status", 
-                    lambda d, n=dev: "Up" if d.get("devices", {}).get(n, {}).get("up", False) else "Down",
+                    ValuePath(("devices", dev, "up"), transform=up_down),
                     icon=get_network_icon()
                 ))
             
             # MTU
-            if "mtu" in dev_data:
+            if dev_data.mtu is not None:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{dev_upper} MTU", 
-                    lambda d, n=dev: d.get("devices", {}).get(n, {}).get("mtu", 0),
+                    ValuePath(("devices", dev, "mtu"), default=0),
                     icon=get_network_icon(),
                     state_class=SensorStateClass.MEASUREMENT
                 ))
 
+            # 吞吐量（由协调器根据 statistics 计数器计算）
+            if dev_data.statistics is not None:
+                for direction in ("rx", "tx"):
+                    entities.append(OpenWrtSensor(
+                        coordinator, f"{dev_upper} {direction.upper()} Rate",
+                        ValuePath(("rates", dev, f"{direction}_bytes")),
+                        unit=UnitOfDataRate.BYTES_PER_SECOND,
+                        icon=get_network_icon(),
+                        state_class=SensorStateClass.MEASUREMENT,
+                        device_class=SensorDeviceClass.DATA_RATE,
+                    ))
+
     # 无线传感器
     if data.get("wireless"):
-        for radio, radio_data in data.get("wireless", {}).items():
-            if isinstance(radio_data, dict) and "interfaces" in radio_data:
-                for iface in radio_data["interfaces"]:
-                    if isinstance(iface, dict):
-                        iface_name = iface.get("ifname", "unknown")
-                        iface_upper = iface_name.upper()
-
-                        # 无线状态
-                        entities.append(OpenWrtSensor(
-                            coordinator, f"{iface_upper} Wireless Status", 
-                            lambda d, r=radio, i=iface_name: "Up" if d.get("wireless", {}).get(r, {}).get("interfaces", []) and any(iface.get("ifname") == i and iface.get("up", False) for iface in d.get("wireless", {}).get(r, {}).get("interfaces", [])) else "Down",
-                            icon=get_wireless_icon()
-                        ))
+        for radio, interfaces in data.get("wireless", {}).items():
+            for iface in interfaces:
+                iface_name = iface.ifname
+                iface_upper = iface_name.upper()
 
-                        # 无线模式
-                        if "mode" in iface:
-                            entities.append(OpenWrtSensor(
-                                coordinator, f"{iface_upper} Wireless Mode", 
-                                lambda d, r=radio, i=iface_name: next((iface.get("mode", "N/A") for iface in d.get("wireless", {}).get(r, {}).get("interfaces", []) if iface.get("ifname") == i), "N/A"),
-                                icon=get_wireless_icon()
-                            ))
+                # 无线状态
+                entities.append(OpenWrtSensor(
+                    coordinator, f"{iface_upper} Wireless Status", 
+                    ValuePath(("wireless_by_ifname", iface_name, "up"), transform=up_down),
+                    icon=get_wireless_icon()
+                ))
+
+                # 无线模式
+                if iface.mode is not None:
+                    entities.append(OpenWrtSensor(
+                        coordinator, f"{iface_upper} Wireless Mode", 
+                        ValuePath(("wireless_by_ifname", iface_name, "mode"), default="N/A"),
+                        icon=get_wireless_icon()
+                    ))
 
     # 如果 network.wireless 不可用，使用 UCI 配置 (wireless_config) 来显示 SSID/模式等
     if data.get("wireless_config"):
@@ -501,20 +495,20 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} SSID",
-                    lambda d, n=name: d.get("wireless_config", {}).get(n, {}).get("ssid", "N/A"),
+                    ValuePath(("wireless_config", name, "ssid"), default="N/A"),
                     icon=get_wireless_icon()
                 ))
 
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} Mode",
-                    lambda d, n=name: d.get("wireless_config", {}).get(n, {}).get("mode", "N/A"),
+                    ValuePath(("wireless_config", name, "mode"), default="N/A"),
                     icon=get_wireless_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                 ))
 
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} Encryption",
-                    lambda d, n=name: d.get("wireless_config", {}).get(n, {}).get("encryption", "N/A"),
+                    ValuePath(("wireless_config", name, "encryption"), default="N/A"),
                     icon=get_wireless_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                 ))
@@ -522,34 +516,34 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     # 使用 wireless_by_ifname 索引展示更贴近 LuCI 的接口名（如果可用）
     if data.get("wireless_by_ifname"):
         for ifname, entry in data.get("wireless_by_ifname", {}).items():
-            display = entry.get("name") or ifname
+            display = entry.name or ifname
             # 若 entry 包含 ssid/device/channel/txpower，显示为传感器
-            if entry.get("ssid"):
+            if entry.ssid:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} SSID",
-                    lambda d, i=ifname: d.get("wireless_by_ifname", {}).get(i, {}).get("ssid", "N/A"),
+                    ValuePath(("wireless_by_ifname", ifname, "ssid"), default="N/A"),
                     icon=get_wireless_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                 ))
-            if entry.get("device"):
+            if entry.device:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} Device",
-                    lambda d, i=ifname: d.get("wireless_by_ifname", {}).get(i, {}).get("device", "N/A"),
+                    ValuePath(("wireless_by_ifname", ifname, "device"), default="N/A"),
                     icon=get_wireless_icon(),
                         entity_category=EntityCategory.DIAGNOSTIC,
                 ))
             # channel/txpower 可能在 wifi-device 条目（在 wireless_config 中）
-            if entry.get("channel"):
+            if entry.channel:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} Channel",
-                    lambda d, i=ifname: d.get("wireless_by_ifname", {}).get(i, {}).get("channel", "N/A"),
+                    ValuePath(("wireless_by_ifname", ifname, "channel"), default="N/A"),
                     icon=get_wireless_icon(),
                     state_class=SensorStateClass.MEASUREMENT
                 ))
-            if entry.get("txpower"):
+            if entry.txpower:
                 entities.append(OpenWrtSensor(
                     coordinator, f"{display} TX Power",
-                    lambda d, i=ifname: d.get("wireless_by_ifname", {}).get(i, {}).get("txpower", "N/A"),
+                    ValuePath(("wireless_by_ifname", ifname, "txpower"), default="N/A"),
                     icon=get_wireless_icon(),
                     unit="dBm",
                     device_class="signal_strength",
@@ -561,14 +555,14 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         if isinstance(data["firewall_status"], dict):
             entities.append(OpenWrtSensor(
                 coordinator, "Firewall Status", 
-                lambda d: "Active" if d.get("firewall_status", {}).get("enabled", False) else "Inactive",
+                ValuePath(("firewall_status", "enabled"), transform=active_inactive),
                 icon=get_firewall_icon()
             ))
             # 防火墙规则数量
             if "rules" in data["firewall_status"]:
                 entities.append(OpenWrtSensor(
                     coordinator, "Firewall Rules", 
-                    lambda d: len(d.get("firewall_status", {}).get("rules", [])),
+                    ValuePath(("firewall_status", "rules"), default=(), transform=len),
                     icon=get_firewall_icon(),
                     state_class=SensorStateClass.MEASUREMENT
                 ))
@@ -576,7 +570,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     # DHCP 租约（使用 LuCI RPC getDHCPLeases 的统计结果，如果 coordinator 提供）
     entities.append(OpenWrtSensor(
         coordinator, "DHCP Clients",
-        lambda d: d.get("dhcp_leases_count", 0),
+        ValuePath(("dhcp_leases_count",), default=0),
         icon=get_network_icon(),
         state_class=SensorStateClass.MEASUREMENT
     ))
@@ -584,78 +578,63 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     # WiFi 客户端统计（优先使用 iwinfo/hostapd 的统计）
     entities.append(OpenWrtSensor(
         coordinator, "WiFi Clients",
-        lambda d: d.get("iw_clients_count", d.get("clients_count", 0)),
+        ValuePath(("iw_clients_count",), ("clients_count",), default=0),
         icon=get_wireless_icon(),
         state_class=SensorStateClass.MEASUREMENT,
     ))
 
     # 进程传感器
-    if data.get("processes"):
-        if isinstance(data["processes"], dict) and "processes" in data["processes"]:
-            process_list = data["processes"]["processes"]
-            if isinstance(process_list, list):
-                entities.append(OpenWrtSensor(
-                    coordinator, "Process Count", 
-                    lambda d: len(d.get("processes", {}).get("processes", [])),
-                    icon=get_process_icon(),
-                    state_class=SensorStateClass.MEASUREMENT
-                ))
+    if data.get("processes_count") is not None:
+        entities.append(OpenWrtSensor(
+            coordinator, "Process Count", 
+            ValuePath(("processes_count",), default=0),
+            icon=get_process_icon(),
+            state_class=SensorStateClass.MEASUREMENT
+        ))
 
     # 服务传感器
-    if data.get("services"):
-        if isinstance(data["services"], dict) and "services" in data["services"]:
-            service_list = data["services"]["services"]
-            if isinstance(service_list, list):
-                entities.append(OpenWrtSensor(
-                    coordinator, "Service Count", 
-                    lambda d: len(d.get("services", {}).get("services", [])),
-                    icon=get_system_icon(),
-                    state_class=SensorStateClass.MEASUREMENT
-                ))
+    if data.get("services_count") is not None:
+        entities.append(OpenWrtSensor(
+            coordinator, "Service Count", 
+            ValuePath(("services_count",), default=0),
+            icon=get_system_icon(),
+            state_class=SensorStateClass.MEASUREMENT
+        ))
 
     # 运行中服务传感器
-    if data.get("running_services"):
-        if isinstance(data["running_services"], dict) and "services" in data["running_services"]:
-            running_list = data["running_services"]["services"]
-            if isinstance(running_list, list):
-                entities.append(OpenWrtSensor(
-                    coordinator, "Running Services", 
-                    lambda d: len(d.get("running_services", {}).get("services", [])),
-                    icon=get_system_icon(),
-                    state_class=SensorStateClass.MEASUREMENT
-                ))
+    if data.get("running_services_count") is not None:
+        entities.append(OpenWrtSensor(
+            coordinator, "Running Services", 
+            ValuePath(("running_services_count",), default=0),
+            icon=get_system_icon(),
+            state_class=SensorStateClass.MEASUREMENT
+        ))
 
-    # 日志传感器
-    if data.get("logs"):
-        if isinstance(data["logs"], dict) and "data" in data["logs"]:
-            log_data = data["logs"]["data"]
-            if isinstance(log_data, list):
-                entities.append(OpenWrtSensor(
-                    coordinator, "Log Count", 
-                    lambda d: len(d.get("logs", {}).get("data", [])),
-                    icon=get_system_icon(),
-                    state_class=SensorStateClass.MEASUREMENT
-                ))
+    # 日志传感器：Home Assistant 启动以来累计读取到的日志行数，不是路由器日志缓冲区的行数
+    if data.get("log_count") is not None:
+        entities.append(OpenWrtSensor(
+            coordinator, "Log Count", 
+            ValuePath(("log_count",), default=0),
+            icon=get_system_icon(),
+            state_class=SensorStateClass.TOTAL_INCREASING
+        ))
 
     # Ubus服务传感器
-    if data.get("ubus_services"):
-        if isinstance(data["ubus_services"], dict) and "services" in data["ubus_services"]:
-            ubus_services = data["ubus_services"]["services"]
-            if isinstance(ubus_services, list):
-                entities.append(OpenWrtSensor(
-                    coordinator, "Ubus Services", 
-                    lambda d: len(d.get("ubus_services", {}).get("services", [])),
-                    icon=get_system_icon(),
-                    state_class=SensorStateClass.MEASUREMENT,
-                    entity_category=EntityCategory.DIAGNOSTIC,
-                ))
+    if data.get("ubus_services_count") is not None:
+        entities.append(OpenWrtSensor(
+            coordinator, "Ubus Services", 
+            ValuePath(("ubus_services_count",), default=0),
+            icon=get_system_icon(),
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ))
 
     # 系统监控传感器
     if data.get("system_monitor"):
         if isinstance(data["system_monitor"], dict):
             entities.append(OpenWrtSensor(
                 coordinator, "System Monitor Status", 
-                lambda d: d.get("system_monitor", {}).get("status", "N/A"),
+                ValuePath(("system_monitor", "status"), default="N/A"),
                 icon=get_system_icon()
             ))
             # diagnostic
@@ -668,7 +647,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 if isinstance(stat_value, (int, float)):
                     entities.append(OpenWrtSensor(
                         coordinator, f"System {stat_name.title()}", 
-                        lambda d, n=stat_name: d.get("system_stats", {}).get(n, 0),
+                        ValuePath(("system_stats", stat_name), default=0),
                         icon=get_system_icon(),
                         state_class=SensorStateClass.MEASUREMENT
                     ))
@@ -679,12 +658,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         temps = data.get("temperatures", {})
         if temps and isinstance(temps, dict):
             for key, info in temps.items():
-                label = info.get("label") or f"Temperature {info.get('zone')}"
-                zone = info.get("zone")
+                label = info.label or f"Temperature {info.zone}"
+                zone = info.zone
                 entities.append(OpenWrtSensor(
                     coordinator,
                     f"{label} ({zone})",
-                    lambda d, k=key: d.get("temperatures", {}).get(k, {}).get("celsius"),
+                    ValuePath(("temperatures", key, "celsius")),
                     unit=UnitOfTemperature.CELSIUS,
                     icon=get_temperature_icon(),
                     state_class=SensorStateClass.MEASUREMENT,
@@ -702,7 +681,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 entities.append(OpenWrtSensor(
                     coordinator,
                     "NF Conntrack Count",
-                    lambda d: d.get("connections", {}).get("nf_conntrack", {}).get("count", 0),
+                    ValuePath(("connections", "nf_conntrack", "count"), default=0),
                     icon=get_network_icon(),
                     state_class=SensorStateClass.MEASUREMENT,
                 ))
@@ -710,7 +689,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 entities.append(OpenWrtSensor(
                     coordinator,
                     "NF Conntrack Max",
-                    lambda d: d.get("connections", {}).get("nf_conntrack", {}).get("max", 0),
+                    ValuePath(("connections", "nf_conntrack", "max"), default=0),
                     icon=get_network_icon(),
                     state_class=SensorStateClass.MEASUREMENT,
                     entity_category=EntityCategory.DIAGNOSTIC,
@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .records import Interface, Memory, NetDevice, WirelessInterface
+
+# 轮询层级：每个数据源声明自己的刷新间隔（秒），FAST 表示每个周期都刷新
+POLL_TIER_FAST = "fast"
+POLL_TIER_NORMAL = "normal"
+POLL_TIER_SLOW = "slow"
+POLL_TIER_STATIC = "static"
+
+POLL_TIER_INTERVALS = {
+    POLL_TIER_FAST: 0,
+    POLL_TIER_NORMAL: 60,
+    POLL_TIER_SLOW: 300,
+    POLL_TIER_STATIC: 3600,
+}
+
+
+# network.device 统计中参与速率计算的计数器，其它计数器不进入快照
+RATE_COUNTERS = (
+    "rx_bytes", "tx_bytes", "rx_packets", "tx_packets",
+    "rx_errors", "tx_errors", "rx_dropped", "tx_dropped",
+)
+
+
+def _as_dict(result):
+    return result if isinstance(result, dict) else {}
+
+
+def convert_bytes_to_mb(bytes_value):
+    """将字节转换为MB"""
+    if bytes_value is None:
+        return 0
+    return round(bytes_value / (1024 * 1024), 2)
+
+
+def calculate_cpu_load_percentage(load_value):
+    """将CPU负载转换为百分比"""
+    if load_value is None:
+        return 0
+    # OpenWrt 24.10+ 的负载值通常是整数，需要转换为百分比
+    # 根据实际测试调整最大负载值
+    max_load = 100000
+    percentage = min((load_value / max_load) * 100, 100)
+    return round(percentage, 2)
+
+
+def parse_system_info(result):
+    """system.info: 内存转换为MB、负载转换为百分比，并拆分运行时间与文件系统"""
+    if not isinstance(result, dict):
+        return {
+            "memory": None,
+            "load": (0, 0, 0),
+            "uptime": {"seconds": 0},
+            "rootfs": {},
+            "tmpfs": {},
+            "swap": {},
+        }
+
+    data = {}
+    if "memory" in result:
+        memory = result["memory"]
+        data["memory"] = Memory(
+            total_mb=convert_bytes_to_mb(memory.get("total", 0)),
+            free_mb=convert_bytes_to_mb(memory.get("free", 0)),
+            shared_mb=convert_bytes_to_mb(memory.get("shared", 0)),
+            buffered_mb=convert_bytes_to_mb(memory.get("buffered", 0)),
+            available_mb=convert_bytes_to_mb(memory.get("available", 0)),
+            cached_mb=convert_bytes_to_mb(memory.get("cached", 0)),
+        )
+    if "load" in result:
+        load = result["load"]
+        data["load"] = (
+            calculate_cpu_load_percentage(load[0]) if len(load) > 0 else 0,
+            calculate_cpu_load_percentage(load[1]) if len(load) > 1 else 0,
+            calculate_cpu_load_percentage(load[2]) if len(load) > 2 else 0,
+        )
+    if "uptime" in result:
+        data["uptime"] = {"seconds": result["uptime"]}
+    if "root" in result:
+        data["rootfs"] = result["root"]
+    if "tmp" in result:
+        data["tmpfs"] = result["tmp"]
+    if "swap" in result:
+        data["swap"] = result["swap"]
+    return data
+
+
+def _addresses(items):
+    return tuple(
+        item["address"] for item in items or () if isinstance(item, dict) and isinstance(item.get("address"), str)
+    )
+
+
+def interface_fields(item):
+    """netifd 接口状态中出现的字段转换为 Interface 的字段；没有出现的字段不返回，事件据此修补记录"""
+    fields = {key: item[key] for key in ("proto", "uptime", "device", "l3_device") if key in item}
+    if "up" in item:
+        fields["up"] = bool(item["up"])
+    if "ipv4-address" in item:
+        fields["ipv4"] = _addresses(item["ipv4-address"])
+    if "ipv6-address" in item:
+        fields["ipv6"] = _addresses(item["ipv6-address"])
+    if "dns-server" in item:
+        fields["dns"] = tuple(str(server) for server in item["dns-server"] or ())
+    return fields
+
+
+def parse_interface_dump(result):
+    """network.interface.dump: 按接口名建立 Interface 索引"""
+    interfaces = {}
+    if isinstance(result, dict) and isinstance(result.get("interface"), list):
+        for iface in result["interface"]:
+            if isinstance(iface, dict):
+                name = iface.get("interface", "unknown")
+                interfaces[name] = Interface(name, **interface_fields(iface))
+    return {"interfaces": interfaces}
+
+
+def parse_device_status(result):
+    """network.device.status: 按设备名建立 NetDevice 索引"""
+    devices = {}
+    if isinstance(result, dict):
+        for name, item in result.items():
+            if not isinstance(item, dict):
+                continue
+            stats = item.get("statistics")
+            devices[name] = NetDevice(
+                name,
+                type=item.get("type"),
+                up=item.get("up"),
+                mtu=item.get("mtu"),
+                statistics=(
+                    {counter: stats[counter] for counter in RATE_COUNTERS if isinstance(stats.get(counter), int)}
+                    if isinstance(stats, dict) else None
+                ),
+            )
+    return {"devices": devices}
+
+
+def _radio_interfaces(radio_data):
+    """射频下的接口列表：标准格式为 {"interfaces": [...]}，有些固件直接放在射频条目或其值中"""
+    if isinstance(radio_data, list):
+        return radio_data
+    if not isinstance(radio_data, dict):
+        return []
+    if isinstance(radio_data.get("interfaces"), list):
+        return radio_data["interfaces"]
+    if "ifname" in radio_data or "name" in radio_data:
+        return [radio_data]
+    return [v for v in radio_data.values() if isinstance(v, dict) and ("ifname" in v or "up" in v or "mode" in v)]
+
+
+def _wireless_interface(radio, radio_data, iface):
+    ifname = iface.get("ifname") or iface.get("name") or iface.get("device")
+    if not ifname:
+        return None
+    # SSID/模式等在标准格式中位于接口的 config 下，up 位于射频条目
+    config = iface.get("config") if isinstance(iface.get("config"), dict) else {}
+    radio_up = radio_data.get("up") if isinstance(radio_data, dict) else None
+    return WirelessInterface(
+        str(ifname),
+        radio,
+        name=iface.get("name"),
+        up=iface.get("up", radio_up),
+        mode=iface.get("mode", config.get("mode")),
+        ssid=iface.get("ssid", config.get("ssid")),
+        device=iface.get("device"),
+        channel=iface.get("channel", config.get("channel")),
+        txpower=iface.get("txpower", config.get("txpower")),
+    )
+
+
+def parse_wireless_radios(result):
+    """network.wireless.status/dump: {radio: (WirelessInterface, ...)}，没有接口的射频不保留"""
+    radios = {}
+    if not isinstance(result, dict):
+        return radios
+    for radio, radio_data in result.items():
+        interfaces = tuple(
+            record for record in (
+                _wireless_interface(radio, radio_data, iface)
+                for iface in _radio_interfaces(radio_data) if isinstance(iface, dict)
+            ) if record is not None
+        )
+        if interfaces:
+            radios[radio] = interfaces
+    return radios
+
+
+def parse_wireless_status(result):
+    """network.wireless.status"""
+    return {"wireless": parse_wireless_radios(result)}
+
+
+def parse_wireless_dump(result):
+    """network.wireless.dump：wireless 为空时由协调器用作后备"""
+    return {"wireless_dump": parse_wireless_radios(result)}
+
+
+def _count_parser(key, field):
+    """只保留结果中列表的长度，列表本身不进入快照"""
+    def parse(result):
+        items = result.get(field) if isinstance(result, dict) else None
+        return {key: len(items)} if isinstance(items, list) else {}
+    return parse
+
+
+def parse_uci_wireless(result):
+    """uci.get wireless: 提取 wifi-device / wifi-iface 配置（用于获取 SSID/mode 等静态配置）"""
+    values = result.get("values") if isinstance(result, dict) else None
+    if not isinstance(values, dict):
+        return {}
+    if not any(isinstance(v, dict) and v.get(".type") in ("wifi-device", "wifi-iface") for v in values.values()):
+        return {}
+    return {"wireless_config": {name: entry for name, entry in values.items() if isinstance(entry, dict)}}
+
+
+@dataclass(frozen=True)
+class PollSource:
+    """轮询数据源描述
+
+    单次调用的数据源通过 namespace/method/params 描述，由协调器统一批量请求，
+    结果交给 parser 转换为 coordinator.data 中的键值（默认原样放入 key）。
+    需要多次调用的复合数据源通过 fetcher 指定协调器上的异步方法名。
+    optional 为 False 的数据源失败时记录 WARNING，其它只记录 DEBUG。
+    heavy 为 True 的数据源在路由器上耗时较长，单独请求，超时时不会拖住其它数据源。
+    diagnostic 为 True 的数据源没有实体使用，只在开启保留原始数据（用于诊断）时才轮询。
+    """
+
+    key: str
+    namespace: str | None = None
+    method: str | None = None
+    params: dict | None = None
+    tier: str = POLL_TIER_NORMAL
+    parser: Callable[[Any], dict] | None = None
+    fetcher: str | None = None
+    optional: bool = True
+    heavy: bool = False
+    diagnostic: bool = False
+
+    def parse(self, result) -> dict:
+        """把原始结果转换为要合并进 coordinator.data 的键值"""
+        if self.fetcher:
+            return _as_dict(result)
+        if self.parser:
+            return self.parser(result)
+        return {self.key: _as_dict(result)}
+
+
+# 轮询数据源注册表 - OpenWrt 24.10+支持的接口
+# 轮询只允许只读方法：network.reload、network.wireless.reload、system.sysupgrade 等
+# 会修改路由器状态的方法不能出现在这里，协调器也会在请求前拒绝它们
+POLL_SOURCES = (
+    # 系统信息
+    PollSource("system_board", "system", "board", tier=POLL_TIER_STATIC, optional=False),
+    PollSource("system_info", "system", "info", tier=POLL_TIER_FAST, parser=parse_system_info, optional=False),
+    PollSource("processes", "system", "processes", tier=POLL_TIER_NORMAL, heavy=True,
+               parser=_count_parser("processes_count", "processes")),
+    PollSource("system_uptime", "system", "uptime", tier=POLL_TIER_FAST, diagnostic=True),
+    PollSource("system_load", "system", "load", tier=POLL_TIER_FAST, diagnostic=True),
+    PollSource("system_memory", "system", "memory", tier=POLL_TIER_FAST, diagnostic=True),
+    PollSource("system_swap", "system", "swap", tier=POLL_TIER_FAST, diagnostic=True),
+    PollSource("system_cpu", "system", "cpu", tier=POLL_TIER_FAST, diagnostic=True),
+
+    # 网络信息
+    PollSource("interfaces", "network.interface", "dump", tier=POLL_TIER_FAST, parser=parse_interface_dump, optional=False),
+    PollSource("devices", "network.device", "status", tier=POLL_TIER_FAST, parser=parse_device_status),
+    PollSource("wireless", "network.wireless", "status", tier=POLL_TIER_NORMAL,
+               parser=parse_wireless_status),
+    PollSource("network_status", "network", "status", tier=POLL_TIER_NORMAL, diagnostic=True),
+
+    # 服务信息
+    PollSource("services", "service", "list", tier=POLL_TIER_SLOW,
+               parser=_count_parser("services_count", "services")),
+    PollSource("running_services", "service", "running", tier=POLL_TIER_SLOW,
+               parser=_count_parser("running_services_count", "services")),
+
+    # 系统状态
+    PollSource("logs", tier=POLL_TIER_NORMAL, fetcher="_fetch_logs"),
+    PollSource("ubus_services", "ubus", "list", tier=POLL_TIER_STATIC,
+               parser=_count_parser("ubus_services_count", "services")),
+
+    # OpenWrt 24.10+ 新增接口
+    PollSource("leds", "system", "led", tier=POLL_TIER_SLOW),
+    PollSource("watchdog", "system", "watchdog", tier=POLL_TIER_SLOW),
+
+    # 网络高级功能
+    PollSource("network_dump", "network", "dump", tier=POLL_TIER_SLOW, heavy=True, diagnostic=True),
+    PollSource("interface_status", "network.interface", "status", tier=POLL_TIER_NORMAL, diagnostic=True),
+    PollSource("device_dump", "network.device", "dump", tier=POLL_TIER_SLOW, diagnostic=True),
+
+    # 防火墙和DHCP
+    PollSource("firewall_status", "firewall", "status", tier=POLL_TIER_SLOW),
+    PollSource("firewall_dump", "firewall", "dump", tier=POLL_TIER_SLOW, heavy=True, diagnostic=True),
+    PollSource("dhcp_status", "dhcp", "status", tier=POLL_TIER_SLOW, diagnostic=True),
+    PollSource("dhcp_leases", "dhcp", "leases", tier=POLL_TIER_NORMAL, diagnostic=True),
+
+    # 无线高级功能
+    PollSource("wireless_dump", "network.wireless", "dump", tier=POLL_TIER_NORMAL,
+               parser=parse_wireless_dump),
+
+    # 系统监控
+    PollSource("system_monitor", "system", "monitor", tier=POLL_TIER_NORMAL),
+    PollSource("system_stats", "system", "stats", tier=POLL_TIER_NORMAL),
+
+    # UCI 中的 wireless 配置
+    PollSource("wireless_config", "uci", "get", {"config": "wireless"}, tier=POLL_TIER_STATIC, parser=parse_uci_wireless),
+
+    # 需要多次调用的复合数据源，依赖上面单次调用的结果
+    PollSource("clients", tier=POLL_TIER_NORMAL, fetcher="_fetch_clients"),
+    PollSource("dhcp", tier=POLL_TIER_NORMAL, fetcher="_fetch_dhcp_leases"),
+    PollSource("temperatures", tier=POLL_TIER_NORMAL, fetcher="_fetch_temperatures"),
+    PollSource("connections", tier=POLL_TIER_FAST, fetcher="_fetch_connections"),
+)
+
+# 可在选项中按路由器禁用的数据源
+SOURCE_KEYS = [source.key for source in POLL_SOURCES]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from .leases import normalize_mac
+
+
+@dataclass(frozen=True, slots=True)
+class Station:
+    """一个无线终端；速率单位为 kbit/s，流量速率单位为字节/秒，inactive 为毫秒"""
+
+    mac: str
+    ifname: str
+    radio: str | None = None
+    signal: int | None = None
+    noise: int | None = None
+    inactive: int | None = None
+    rx_rate: int | None = None
+    tx_rate: int | None = None
+    rx_bytes: int | None = None
+    tx_bytes: int | None = None
+    rx_bytes_rate: float | None = None
+    tx_bytes_rate: float | None = None
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _int(value):
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def _pair(item, key, direction):
+    """取出 {"rx": ..., "tx": ...} 形式的嵌套值"""
+    value = item.get(key)
+    return _int(value.get(direction)) if isinstance(value, dict) else None
+
+
+def parse_hostapd_clients(ifname, radio, res):
+    """hostapd.<ifname> get_clients: {"clients": {mac: {signal, rate: {rx, tx}, bytes: {rx, tx}, ...}}}"""
+    clients = res.get("clients") if isinstance(res, dict) else None
+    if not isinstance(clients, dict):
+        return []
+    stations = []
+    for mac, item in clients.items():
+        mac = normalize_mac(mac)
+        if not mac or not isinstance(item, dict):
+            continue
+        stations.append(Station(
+            mac, ifname, radio,
+            signal=_int(item.get("signal")),
+            inactive=_int(item.get("inactive")),
+            rx_rate=_pair(item, "rate", "rx"),
+            tx_rate=_pair(item, "rate", "tx"),
+            rx_bytes=_pair(item, "bytes", "rx"),
+            tx_bytes=_pair(item, "bytes", "tx"),
+        ))
+    return stations
+
+
+def parse_iwinfo_assoclist(ifname, radio, res):
+    """iwinfo assoclist: {"results": [{mac, signal, noise, inactive, rx: {rate, bytes}, tx: {rate, bytes}}]}"""
+    items = res.get("results") if isinstance(res, dict) else res
+    if not isinstance(items, list):
+        return []
+    stations = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        mac = normalize_mac(item.get("mac"))
+        if not mac:
+            continue
+        rx = item.get("rx") if isinstance(item.get("rx"), dict) else {}
+        tx = item.get("tx") if isinstance(item.get("tx"), dict) else {}
+        stations.append(Station(
+            mac, ifname, radio,
+            signal=_int(item.get("signal")),
+            noise=_int(item.get("noise")),
+            inactive=_int(item.get("inactive")),
+            rx_rate=_int(rx.get("rate")),
+            tx_rate=_int(tx.get("rate")),
+            rx_bytes=_int(rx.get("bytes")),
+            tx_bytes=_int(tx.get("bytes")),
+        ))
+    return stations
+
+
+def _merge(primary, extra):
+    """hostapd 的记录优先，缺少的字段用 iwinfo 的补齐"""
+    missing = {
+        name: getattr(extra, name)
+        for name in ("signal", "noise", "inactive", "rx_rate", "tx_rate", "rx_bytes", "tx_bytes")
+        if getattr(primary, name) is None and getattr(extra, name) is not None
+    }
+    return replace(primary, **missing) if missing else primary
+
+
+class StationTable:
+    """按 MAC 索引的无线终端表，跨所有射频/接入点合并，并根据两次轮询间的字节数计算流量速率"""
+
+    __slots__ = ("_stations", "_counters")
+
+    def __init__(self):
+        self._stations: dict[str, Station] = {}
+        # {mac: (获取时间 monotonic, rx_bytes, tx_bytes)}
+        self._counters: dict[str, tuple] = {}
+
+    def __len__(self):
+        return len(self._stations)
+
+    @property
+    def data(self) -> dict:
+        return self._stations
+
+    def reset(self):
+        """路由器重启后计数器清零，丢弃旧的基准"""
+        self._counters = {}
+
+    def update(self, hostapd, iwinfo, stamp) -> dict:
+        """用本轮 hostapd/iwinfo 记录重建终端表，返回 {mac: Station}"""
+        stations = {}
+        for station in hostapd:
+            stations.setdefault(station.mac, station)
+        for station in iwinfo:
+            current = stations.get(station.mac)
+            stations[station.mac] = station if current is None else _merge(current, station)
+
+        counters = {}
+        for mac, station in stations.items():
+            if station.rx_bytes is None and station.tx_bytes is None:
+                continue
+            counters[mac] = (stamp, station.rx_bytes, station.tx_bytes)
+            previous = self._counters.get(mac)
+            if previous is None or stamp <= previous[0]:
+                continue
+            elapsed = stamp - previous[0]
+            rates = {}
+            for name, value, prev_value in (
+                ("rx_bytes_rate", station.rx_bytes, previous[1]),
+                ("tx_bytes_rate", station.tx_bytes, previous[2]),
+            ):
+                # 计数器变小说明终端重新关联，本次只记录新的基准
+                if value is not None and prev_value is not None and value >= prev_value:
+                    rates[name] = round((value - prev_value) / elapsed, 2)
+            if rates:
+                stations[mac] = replace(station, **rates)
+
+        self._counters = counters
+        self._stations = stations
+        return stations
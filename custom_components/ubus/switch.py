@@ -14,7 +14,8 @@ class OpenWrtInterfaceSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to control a network interface on OpenWrt"""
 
     def __init__(self, coordinator, interface_name: str):
-        super().__init__(coordinator)
+        # Only woken by the coordinator when the interface table changes
+        super().__init__(coordinator, context=frozenset({"interfaces"}))
         # Disable switch entities by default; user must enable them in the entity registry
         try:
             self._attr_entity_registry_enabled_default = False
@@ -42,8 +43,8 @@ class OpenWrtInterfaceSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool | None:
         data = self.coordinator.data or {}
-        iface = data.get("interfaces", {}).get(self._interface, {})
-        return iface.get("up", None)
+        iface = data.get("interfaces", {}).get(self._interface)
+        return iface.up if iface is not None else None
 
     async def async_turn_on(self, **kwargs) -> None:
         """Bring interface up (if supported)"""
@@ -178,7 +179,7 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities: AddE
         except Exception as e:
             _LOGGER.debug("Failed to schedule coordinator update handler: %s", e)
 
-    remove_listener = coordinator.async_add_listener(_handle_coordinator_update)
+    remove_listener = coordinator.async_add_listener(_handle_coordinator_update, frozenset({"interfaces"}))
     # Ensure listener is removed when config entry is unloaded
     try:
         entry.async_on_unload(remove_listener)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+_MISSING = object()
+
+
+def up_down(value):
+    return "Up" if value else "Down"
+
+
+def yes_no(value):
+    return "Yes" if value else "No"
+
+
+def active_inactive(value):
+    return "Active" if value else "Inactive"
+
+
+def _compile_path(path):
+    """把路径编译为取值函数：字符串按字典键或记录字段、整数按列表下标逐级访问，任何一级缺失返回 _MISSING"""
+    if len(path) == 1:
+        key = path[0]
+
+        def get(data):
+            return data.get(key, _MISSING)
+        return get
+
+    def get(data):
+        node = data
+        for key in path:
+            if isinstance(node, dict):
+                node = node.get(key, _MISSING)
+                if node is _MISSING:
+                    return _MISSING
+            elif isinstance(key, int) and isinstance(node, (list, tuple)) and -len(node) <= key < len(node):
+                node = node[key]
+            elif isinstance(key, str) and key in getattr(type(node), "__dataclass_fields__", ()):
+                # 记录中值为 None 的字段表示路由器没有上报，与字典中缺少的键一样使用默认值
+                node = getattr(node, key)
+                if node is None:
+                    return _MISSING
+            else:
+                return _MISSING
+        return node
+    return get
+
+
+class ValuePath:
+    """实体取值描述：coordinator.data 中的路径、缺失时的默认值与可选的转换函数
+
+    可以给出多条路径，按顺序使用第一条存在的路径。路径在创建时编译为取值函数，
+    路径的第一级即实体依赖的数据键（用作协调器监听器的上下文）。
+    """
+
+    __slots__ = ("paths", "default", "transform", "keys", "_getters")
+
+    def __init__(self, *paths, default=None, transform=None):
+        self.paths = tuple(tuple(path) if isinstance(path, (tuple, list)) else (path,) for path in paths)
+        self.default = default
+        self.transform = transform
+        self.keys = frozenset(path[0] for path in self.paths)
+        self._getters = tuple(_compile_path(path) for path in self.paths)
+
+    def __call__(self, data):
+        value = self.default
+        for getter in self._getters:
+            found = getter(data)
+            if found is not _MISSING:
+                value = found
+                break
+        return self.transform(value) if self.transform is not None else value
+
+
+class SnapshotValues:
+    """一个平台全部实体的取值缓存
+
+    每个新的 coordinator.data 快照只批量计算一次；依赖的数据键仍是同一个对象时沿用上次的结果。
+    """
+
+    def __init__(self):
+        self._specs = {}
+        self._values = {}
+        self._data = None
+        self.version = 0
+
+    def register(self, owner, spec: ValuePath):
+        self._specs[owner] = spec
+        self._values.pop(owner, None)
+
+    def unregister(self, owner):
+        self._specs.pop(owner, None)
+        self._values.pop(owner, None)
+
+    def get(self, data, owner):
+        if data is None:
+            return None
+        if data is not self._data:
+            self._refresh(data)
+        if owner not in self._values:
+            self._values[owner] = self._evaluate(self._specs[owner], data)
+        return self._values[owner]
+
+    def _refresh(self, data):
+        previous = self._data or {}
+        values = self._values
+        for owner, spec in self._specs.items():
+            if owner in values and all(data.get(key) is previous.get(key) for key in spec.keys):
+                continue
+            values[owner] = self._evaluate(spec, data)
+        self._data = data
+        self.version += 1
+
+    @staticmethod
+    def _evaluate(spec, data):
+        try:
+            return spec(data)
+        except Exception:
+            return None
@@ -0,0 +1,55 @@
+import importlib.util
+import pathlib
+import sys
+import unittest
+
+# 直接加载 logs.py，不经过依赖 Home Assistant 的包 __init__
+_PATH = pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "ubus" / "logs.py"
+_SPEC = importlib.util.spec_from_file_location("ubus_logs", _PATH)
+logs = importlib.util.module_from_spec(_SPEC)
+# dataclass 需要通过 sys.modules 找到所在模块
+sys.modules[_SPEC.name] = logs
+_SPEC.loader.exec_module(logs)
+
+
+def _reply(first, last):
+    """模拟 logd 对 log.read 的应答"""
+    return {"log": [
+        {"id": i, "msg": f"line {i}", "time": 1700000000 + i, "priority": 30, "source": 1}
+        for i in range(first, last + 1)
+    ]}
+
+
+class LogTailTest(unittest.TestCase):
+    def test_read_params_disable_stream(self):
+        """不关闭 stream 时 logd 不会结束应答，请求一直占用 uhttpd 的连接"""
+        params = logs.log_read_params(100)
+        self.assertEqual(params, {"lines": 100, "stream": False, "oneshot": True})
+
+    def test_reply_reaches_tail(self):
+        tail = logs.LogTail()
+        self.assertEqual(tail.update(logs.parse_log_entries(_reply(1, 10))), 10)
+        self.assertEqual([r.msg for r in tail.records], [f"line {i}" for i in range(1, 11)])
+
+        # 与上次读取重叠的部分只计一次
+        self.assertEqual(tail.update(logs.parse_log_entries(_reply(6, 15))), 5)
+        self.assertEqual(tail.records[-1].id, 15)
+        self.assertEqual(tail.total, 15)
+        self.assertEqual(tail.gaps, 0)
+
+    def test_total_keeps_counting_after_ring_is_full(self):
+        """log_count 为累计读取的行数，缓冲区满了以后仍然增加"""
+        tail = logs.LogTail()
+        last = 0
+        while last < logs.LOG_RING_LINES * 2:
+            tail.update(logs.parse_log_entries(_reply(last + 1, last + 50)))
+            last += 50
+        self.assertEqual(len(tail), logs.LOG_RING_LINES)
+        self.assertEqual(tail.total, logs.LOG_RING_LINES * 2)
+
+    def test_unknown_reply(self):
+        self.assertIsNone(logs.parse_log_entries({"error": "x"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
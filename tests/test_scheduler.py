@@ -0,0 +1,77 @@
+import asyncio
+import importlib.util
+import pathlib
+import unittest
+
+# 直接加载 scheduler.py，不经过依赖 Home Assistant 的包 __init__
+_PATH = pathlib.Path(__file__).resolve().parents[1] / "custom_components" / "ubus" / "scheduler.py"
+_SPEC = importlib.util.spec_from_file_location("ubus_scheduler", _PATH)
+scheduler = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(scheduler)
+
+
+class RequestSchedulerTest(unittest.TestCase):
+    def test_cancelled_waiter_popped_by_release(self):
+        """排队的请求被取消、同一轮事件循环中名额又被释放时，仍然抛出 CancelledError"""
+
+        async def run():
+            sched = scheduler.RequestScheduler(1)
+            held = sched.slot()
+            await held.__aenter__()
+
+            async def queued():
+                async with sched.slot():
+                    pass
+
+            waiter_task = asyncio.ensure_future(queued())
+            await asyncio.sleep(0)
+            self.assertEqual(sched.depth, 1)
+
+            # 取消排队的请求后、它恢复运行之前释放名额：_release() 会弹出已取消的 future
+            waiter_task.cancel()
+            await held.__aexit__(None, None, None)
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter_task
+
+            self.assertEqual(sched.depth, 0)
+            self.assertEqual(sched.stats()["active"], 0)
+            async with sched.slot():
+                self.assertEqual(sched.stats()["active"], 1)
+
+        asyncio.run(run())
+
+    def test_set_limit(self):
+        """调低上限后释放的名额被收回，调高后立即唤醒排队的请求"""
+
+        async def run():
+            sched = scheduler.RequestScheduler(2)
+            first, second = sched.slot(), sched.slot()
+            await first.__aenter__()
+            await second.__aenter__()
+            sched.set_limit(1)
+
+            entered = []
+
+            async def queued(tag):
+                async with sched.slot():
+                    entered.append(tag)
+                    await asyncio.sleep(0)
+
+            tasks = [asyncio.ensure_future(queued(tag)) for tag in ("a", "b")]
+            await asyncio.sleep(0)
+            await first.__aexit__(None, None, None)
+            await asyncio.sleep(0)
+            self.assertEqual(entered, [])
+            self.assertEqual(sched.stats()["active"], 1)
+
+            sched.set_limit(3)
+            await asyncio.gather(*tasks)
+            self.assertEqual(entered, ["a", "b"])
+            await second.__aexit__(None, None, None)
+            self.assertEqual(sched.stats()["active"], 0)
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()